@@ -13,9 +13,10 @@ Writes: state.action_proposed
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+from collections.abc import Mapping
+from typing import Any, Callable
 
-from hti_arm_demo.shared_state import ArmSharedState
+from hti_arm_demo.shared_state import ArmObs, ArmSharedState
 from hti_arm_demo.brains.base import ArmBrainPolicy
 
 
@@ -26,18 +27,29 @@ class ControlBand:
     Runs at 50 Hz (every 2 ticks).
     """
 
-    def __init__(self, brain: ArmBrainPolicy, brain_name: str = "unknown") -> None:
+    def __init__(
+        self,
+        brain: ArmBrainPolicy,
+        brain_name: str = "unknown",
+        obs_filter: Callable[[ArmObs], Mapping[str, float]] | None = None,
+    ) -> None:
         """
         Initialize with pluggable brain.
 
         Args:
             brain: Any object implementing ArmBrainPolicy protocol
             brain_name: Name for tracking in EventPack metadata (v0.5)
+            obs_filter: Optional anti-corruption hook, SharedState obs →
+                brain obs (any Mapping by name; in-tree brains accept it).
+                None (default) passes state.obs through directly.
         """
         self._brain = brain
         self._brain_name = brain_name
+        self._obs_filter = obs_filter
         self._brain_state: dict[str, Any] = {}
-        self._initialized: bool = False
+        # step is rebound per instance: guard until reset_episode(), then
+        # the unguarded hot path (checked once, not every tick)
+        self.step: Callable[[ArmSharedState], None] = self._step_uninit
 
     def reset_episode(self) -> None:
         """
@@ -46,31 +58,25 @@ class ControlBand:
         Initializes brain state for new episode.
         """
         self._brain_state.clear()
-        self._initialized = True
+        self.step = self._step_ready
 
-    def _build_brain_obs(self, obs: Mapping[str, float]) -> Mapping[str, float]:
-        """
-        Anti-corruption layer: SharedState → brain observation.
-
-        For v0.4, pass through directly. Future versions may add filtering.
-        """
-        return obs
+    def _step_uninit(self, state: ArmSharedState) -> None:
+        """step() before reset_episode(): contract violation."""
+        raise RuntimeError(
+            "ControlBand.step() called before reset_episode(). "
+            "Scheduler must call reset_episode() after env.reset()."
+        )
 
-    def step(self, state: ArmSharedState) -> None:
+    def _step_ready(self, state: ArmSharedState) -> None:
         """
-        Compute action proposal using brain.
+        Compute action proposal using brain (bound as step after reset).
 
         Reads: state.obs
         Writes: state.action_proposed
         """
-        if not self._initialized:
-            raise RuntimeError(
-                "ControlBand.step() called before reset_episode(). "
-                "Scheduler must call reset_episode() after env.reset()."
-            )
-
-        # Translate observation
-        obs_view = self._build_brain_obs(state.obs)
+        # Translate observation (anti-corruption hook, off by default)
+        obs_filter = self._obs_filter
+        obs_view = state.obs if obs_filter is None else obs_filter(state.obs)
 
         # Delegate to brain
         (tau1, tau2), new_state = self._brain.step(obs_view, self._brain_state)
@@ -12,13 +12,59 @@ Writes: state.reflex_flags
 
 from __future__ import annotations
 
-from hti_arm_demo.shared_state import ArmSharedState, ArmReflexFlags
+from typing import Tuple
+
+from hti_arm_demo.shared_state import OBS_IDX, ArmSharedState, ArmReflexFlags
 from hti_arm_demo.env import THETA_MIN, THETA_MAX, OMEGA_MAX
 
 
 # Safety margins
 JOINT_LIMIT_MARGIN = 0.3  # radians - warn when this close to limits
 VELOCITY_FAST_FACTOR = 0.7  # fraction of OMEGA_MAX considered "too fast"
+_OMEGA_FAST_THRESH = VELOCITY_FAST_FACTOR * OMEGA_MAX  # precomputed, rad/s
+
+# Observation slots (positions in ArmObs.arr, from OBS_IDX)
+_THETA1 = OBS_IDX["theta1"]
+_THETA2 = OBS_IDX["theta2"]
+_OMEGA1 = OBS_IDX["omega1"]
+_OMEGA2 = OBS_IDX["omega2"]
+
+
+def _reflex_core(
+    theta1: float,
+    theta2: float,
+    omega1: float,
+    omega2: float,
+) -> Tuple[float, float, bool, bool, bool]:
+    """
+    Scalar core of the reflex checks.
+
+    Pure function of the joint state, kept free of objects so the whole
+    computation is a handful of float ops per tick.
+
+    Returns:
+        (d1, d2, joint1_near, joint2_near, joints_too_fast)
+    """
+    # Distance to nearest joint limits
+    d1_min = abs(theta1 - THETA_MIN)
+    d1_max = abs(THETA_MAX - theta1)
+    d2_min = abs(theta2 - THETA_MIN)
+    d2_max = abs(THETA_MAX - theta2)
+    d1 = d1_min if d1_min < d1_max else d1_max
+    d2 = d2_min if d2_min < d2_max else d2_max
+
+    # Velocity thresholds
+    joints_too_fast = (
+        abs(omega1) >= _OMEGA_FAST_THRESH or abs(omega2) >= _OMEGA_FAST_THRESH
+    )
+
+    return (
+        d1,
+        d2,
+        d1 <= JOINT_LIMIT_MARGIN,
+        d2 <= JOINT_LIMIT_MARGIN,
+        joints_too_fast,
+    )
 
 
 class ReflexBand:
@@ -28,48 +74,37 @@ class ReflexBand:
     Runs at 100 Hz (every tick).
     """
 
+    def __init__(self) -> None:
+        # Reused every tick (overwritten in place) to avoid a per-tick allocation
+        self._flags = ArmReflexFlags(
+            joint1_near_limit=False,
+            joint2_near_limit=False,
+            joint1_distance_to_limit=0.0,
+            joint2_distance_to_limit=0.0,
+            joints_too_fast=False,
+            near_obstacle=False,
+            obstacle_distance=None,
+        )
+
     def step(self, state: ArmSharedState) -> None:
         """
         Detect safety-relevant conditions.
 
         Reads: state.obs
-        Writes: state.reflex_flags
+        Writes: state.reflex_flags (overwritten in place every tick)
         """
-        obs = state.obs
-
-        # Extract joint state
-        theta1 = obs["theta1"]
-        theta2 = obs["theta2"]
-        omega1 = obs["omega1"]
-        omega2 = obs["omega2"]
-
-        # Compute distance to nearest joint limits
-        d1_min = abs(theta1 - THETA_MIN)
-        d1_max = abs(THETA_MAX - theta1)
-        d2_min = abs(theta2 - THETA_MIN)
-        d2_max = abs(THETA_MAX - theta2)
-
-        d1 = min(d1_min, d1_max)
-        d2 = min(d2_min, d2_max)
-
-        # Check proximity to limits
-        joint1_near = d1 <= JOINT_LIMIT_MARGIN
-        joint2_near = d2 <= JOINT_LIMIT_MARGIN
-
-        # Check velocity thresholds
-        joints_too_fast = (
-            abs(omega1) >= VELOCITY_FAST_FACTOR * OMEGA_MAX
-            or abs(omega2) >= VELOCITY_FAST_FACTOR * OMEGA_MAX
-        )
+        arr = state.obs.arr
 
-        # Create flags (no obstacles in v0.4)
-        flags = ArmReflexFlags(
-            joint1_near_limit=joint1_near,
-            joint2_near_limit=joint2_near,
-            joint1_distance_to_limit=d1,
-            joint2_distance_to_limit=d2,
-            joints_too_fast=joints_too_fast,
-            near_obstacle=False,  # stubbed for v0.4
-            obstacle_distance=None,
+        # Joint state (by OBS_IDX slot) → limit/velocity checks
+        d1, d2, joint1_near, joint2_near, joints_too_fast = _reflex_core(
+            arr[_THETA1], arr[_THETA2], arr[_OMEGA1], arr[_OMEGA2]
         )
+
+        # Update flags (no obstacles in v0.4: near_obstacle stays False)
+        flags = self._flags
+        flags.joint1_near_limit = joint1_near
+        flags.joint2_near_limit = joint2_near
+        flags.joint1_distance_to_limit = d1
+        flags.joint2_distance_to_limit = d2
+        flags.joints_too_fast = joints_too_fast
         state.reflex_flags = flags
@@ -14,10 +14,18 @@ from __future__ import annotations
 
 import math
 
-from hti_arm_demo.shared_state import ArmSharedState, ArmSemanticsAdvice
+from hti_arm_demo.shared_state import OBS_IDX, ArmSharedState, ArmSemanticsAdvice
 from hti_arm_demo.env import WORKSPACE_TOL
 
 
+# Observation slots (positions in ArmObs.arr, from OBS_IDX)
+_X_EE = OBS_IDX["x_ee"]
+_Y_EE = OBS_IDX["y_ee"]
+_X_GOAL = OBS_IDX["x_goal"]
+_Y_GOAL = OBS_IDX["y_goal"]
+_STAGE_INDEX = OBS_IDX["stage_index"]
+
+
 class SemanticsBand:
     """
     High-level task band for waypoint A → B → C navigation.
@@ -25,6 +33,10 @@ class SemanticsBand:
     Runs at 10 Hz (every 10 ticks).
     """
 
+    def __init__(self) -> None:
+        # Reused every step (overwritten in place) to avoid an allocation
+        self._advice = ArmSemanticsAdvice(stage_index=0, x_goal=0.0, y_goal=0.0)
+
     def step(self, state: ArmSharedState) -> None:
         """
         Update task-level advice based on current state.
@@ -32,28 +44,23 @@ class SemanticsBand:
         Checks if end-effector has reached current waypoint and
         updates advice accordingly.
         """
-        obs = state.obs
+        arr = state.obs.arr
 
-        # Extract current positions
-        x_ee = obs["x_ee"]
-        y_ee = obs["y_ee"]
-        x_goal = obs["x_goal"]
-        y_goal = obs["y_goal"]
-        stage_index = int(obs["stage_index"])
+        # Extract current positions (by OBS_IDX slot)
+        x_ee, y_ee = arr[_X_EE], arr[_Y_EE]
+        x_goal, y_goal = arr[_X_GOAL], arr[_Y_GOAL]
+        stage_index = int(arr[_STAGE_INDEX])
 
         # Compute distance to current goal
-        dx = x_goal - x_ee
-        dy = y_goal - y_ee
-        dist = math.sqrt(dx * dx + dy * dy)
+        dist = math.hypot(x_goal - x_ee, y_goal - y_ee)
 
         # Check if waypoint reached
         stage_complete = dist <= WORKSPACE_TOL
 
         # Write semantics advice
-        advice = ArmSemanticsAdvice(
-            stage_index=stage_index,
-            x_goal=x_goal,
-            y_goal=y_goal,
-            stage_complete=stage_complete,
-        )
+        advice = self._advice
+        advice.stage_index = stage_index
+        advice.x_goal = x_goal
+        advice.y_goal = y_goal
+        advice.stage_complete = stage_complete
         state.semantics_advice = advice
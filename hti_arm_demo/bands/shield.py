@@ -14,9 +14,9 @@ Logs: ArmEventPack on intervention
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Callable
 
-from hti_arm_demo.shared_state import ArmSharedState, ArmEventPack
+from hti_arm_demo.shared_state import ArmObs, ArmSharedState, ArmEventPack
 from hti_arm_demo.env import TAU_MAX
 
 
@@ -32,14 +32,10 @@ class SafetyShield:
     u_max: float = TAU_MAX
     near_limit_scale: float = 0.5  # scale torques when joints near limit
 
-    def _clip(self, value: float) -> float:
-        """Clip value to [u_min, u_max]."""
-        return max(self.u_min, min(self.u_max, value))
-
     def apply(
         self,
         state: ArmSharedState,
-        events: List[ArmEventPack]
+        log_event: Callable[[ArmEventPack], None]
     ) -> None:
         """
         Enforce safety bounds on proposed action.
@@ -53,7 +49,8 @@ class SafetyShield:
             - state.action_final: safe torques for env.step()
 
         Logs:
-            - Appends ArmEventPack to events list on intervention
+            - Passes ArmEventPack to log_event (e.g. EventLogger.log or
+              list.append) on intervention
         """
         # Default to zero torques if no proposal
         if state.action_proposed is None:
@@ -62,23 +59,35 @@ class SafetyShield:
             proposed = state.action_proposed
 
         tau1, tau2 = proposed
+        rf = state.reflex_flags
+        u_min = self.u_min
+        u_max = self.u_max
 
-        # Scale down near limits or high velocities
-        scale = 1.0
-        if state.reflex_flags is not None:
-            if (state.reflex_flags.joint1_near_limit or
-                state.reflex_flags.joint2_near_limit):
-                scale *= self.near_limit_scale
-
-            if state.reflex_flags.joints_too_fast:
-                scale *= self.near_limit_scale
-
-        tau1_scaled = tau1 * scale
-        tau2_scaled = tau2 * scale
+        # Count raised conditions: near a joint limit, moving too fast
+        if rf is None:
+            n_scale = 0
+        else:
+            n_scale = (rf.joint1_near_limit | rf.joint2_near_limit) + rf.joints_too_fast
+
+        # Fast path: no reflex flag raised and torques already in bounds,
+        # so the proposal passes through unchanged (no intervention)
+        if (n_scale == 0
+                and u_min <= tau1 <= u_max
+                and u_min <= tau2 <= u_max):
+            state.action_final = proposed
+            return
+
+        # Scale down near limits or high velocities (once per condition)
+        s = self.near_limit_scale
+        scale = 1.0 if n_scale == 0 else (s if n_scale == 1 else s * s)
+
+        # Scale, then clip to hard bounds [u_min, u_max]; same results as
+        # max(u_min, min(u_max, v)), including NaN → u_max
+        v = tau1 * scale
+        tau1_final = v if u_min < v < u_max else (u_min if v <= u_min else u_max)
+        v = tau2 * scale
+        tau2_final = v if u_min < v < u_max else (u_min if v <= u_min else u_max)
 
-        # Hard bounds
-        tau1_final = self._clip(tau1_scaled)
-        tau2_final = self._clip(tau2_scaled)
         final = (tau1_final, tau2_final)
 
         # Write final action
@@ -91,7 +100,7 @@ class SafetyShield:
                 timestamp=state.t,
                 tick=state.tick,
                 band="SafetyShield",
-                obs_before=dict(state.obs),
+                obs_before=ArmObs(state.obs.arr.copy()),
                 action_proposed=proposed,
                 action_final=final,
                 reason="clip_or_scale",
@@ -101,4 +110,4 @@ class SafetyShield:
                     "brain_name": state.brain_name,  # v0.5: track which brain
                 },
             )
-            events.append(pack)
+            log_event(pack)
@@ -0,0 +1,141 @@
+"""
+PD gain sweep for HTI arm demo.
+
+Runs one full HTI episode (Semantics → Control → Reflex → Shield → env)
+per Kd value and reports ticks, interventions and success. This is the
+grid search behind ArmOptimalPDBrain, made reusable. Episodes are
+independent, so they are spread over worker processes.
+
+Usage:
+    python -m hti_arm_demo.batch_sweep
+    python -m hti_arm_demo.batch_sweep --Kp 8.0 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from hti_arm_demo.env import ToyArmEnv
+from hti_arm_demo.brains.registry import create_arm_brain
+from hti_arm_demo.bands.semantics import SemanticsBand
+from hti_arm_demo.bands.control import ControlBand
+from hti_arm_demo.bands.reflex import ReflexBand
+from hti_arm_demo.bands.shield import SafetyShield
+from hti_arm_demo.event_log import EventLogger
+from hti_arm_demo.scheduler import run_episode
+
+
+# Kd grid from the damping validation experiment (see arm_optimal_pd.py)
+DEFAULT_KD_GRID = (0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0, 5.56, 6.0, 7.0)
+
+
+@dataclass
+class SweepResult:
+    """Outcome of one PD episode in a gain sweep."""
+    Kp: float
+    Kd: float
+    ticks: int
+    shield_interventions: int
+    all_waypoints_reached: bool
+
+
+def _run_pd_episode(Kp: float, Kd: float, max_ticks: int) -> SweepResult:
+    """Run one PD episode (module-level so worker processes can pickle it)."""
+    brain = create_arm_brain("pd", {"Kp": Kp, "Kd": Kd})
+    stats = run_episode(
+        env=ToyArmEnv(),
+        semantics=SemanticsBand(),
+        control=ControlBand(brain, brain_name="pd"),
+        reflex=ReflexBand(),
+        shield=SafetyShield(),
+        event_logger=EventLogger(record=False),  # events not needed
+        max_ticks=max_ticks,
+        verbose=False,
+    )
+    return SweepResult(
+        Kp=Kp,
+        Kd=Kd,
+        ticks=stats.ticks,
+        shield_interventions=stats.shield_interventions,
+        all_waypoints_reached=stats.all_waypoints_reached,
+    )
+
+
+def sweep_pd_gains(
+    kd_values: Sequence[float] = DEFAULT_KD_GRID,
+    Kp: float = 8.0,
+    max_ticks: int = 2000,
+    workers: int | None = None,
+) -> List[SweepResult]:
+    """
+    Run one PD episode per Kd value, in parallel.
+
+    Args:
+        kd_values: Derivative gains to evaluate
+        Kp: Proportional gain (fixed across the sweep)
+        max_ticks: Maximum ticks per episode
+        workers: Worker processes (default: CPU count; 1 runs serially)
+
+    Returns:
+        One SweepResult per Kd value, in input order
+    """
+    n = len(kd_values)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, n)
+
+    if workers <= 1:
+        return [_run_pd_episode(Kp, Kd, max_ticks) for Kd in kd_values]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_pd_episode, [Kp] * n, kd_values, [max_ticks] * n))
+
+
+def main():
+    """CLI entry point for PD gain sweep."""
+    parser = argparse.ArgumentParser(
+        description="HTI arm demo - PD gain sweep (Kd grid search)"
+    )
+
+    parser.add_argument(
+        "--Kp",
+        type=float,
+        default=8.0,
+        help="Proportional gain held fixed during the sweep (default: 8.0)"
+    )
+
+    parser.add_argument(
+        "--max-ticks",
+        type=int,
+        default=2000,
+        help="Maximum ticks per episode (default: 2000)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)"
+    )
+
+    args = parser.parse_args()
+
+    results = sweep_pd_gains(Kp=args.Kp, max_ticks=args.max_ticks, workers=args.workers)
+
+    print(f"\n=== PD Gain Sweep (Kp={args.Kp}) ===")
+    print(f"{'Kd':>6}  {'ticks':>6}  {'interventions':>13}  success")
+    for r in results:
+        print(f"{r.Kd:6.2f}  {r.ticks:6d}  {r.shield_interventions:13d}  {r.all_waypoints_reached}")
+
+    successful = [r for r in results if r.all_waypoints_reached]
+    if successful:
+        best = min(successful, key=lambda r: r.ticks)
+        print(f"\nFastest successful: Kd={best.Kd:.2f} ({best.ticks} ticks)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Closed-form inverse kinematics for 2-link planar arm brains.
+
+Single definition shared by the P/PD controller modules and _kernels.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Tuple
+
+
+def inverse_kinematics_2dof(
+    x_goal: float,
+    y_goal: float,
+    L1: float,
+    L2: float
+) -> Tuple[float, float]:
+    """
+    Closed-form inverse kinematics for 2-link planar arm.
+
+    Uses standard geometric solution:
+    - Law of cosines for elbow angle (theta2)
+    - Geometry for shoulder angle (theta1)
+
+    Args:
+        x_goal, y_goal: Desired end-effector position in workspace
+        L1, L2: Link lengths
+
+    Returns:
+        (theta1, theta2): Joint angles to reach goal
+
+    Handles edge cases:
+    - Unreachable targets: scaled to workspace boundary
+    - Too-close targets: pushed to minimum reach
+    - Singularities: numerical clamping
+    """
+    # Distance from origin to goal
+    r_sq = x_goal**2 + y_goal**2
+    r = math.sqrt(r_sq)
+
+    # Workspace reachability limits
+    max_reach = L1 + L2
+    min_reach = abs(L1 - L2)
+
+    # Handle unreachable targets
+    if r > max_reach:
+        # Scale goal to workspace boundary
+        scale = max_reach / r
+        x_goal *= scale
+        y_goal *= scale
+        r = max_reach
+        r_sq = r**2
+    elif r < min_reach:
+        # Push outward to minimum reach
+        scale = min_reach / r if r > 1e-6 else 1.0
+        x_goal *= scale
+        y_goal *= scale
+        r = min_reach
+        r_sq = r**2
+
+    # Elbow angle via law of cosines
+    # cos(theta2) = (r^2 - L1^2 - L2^2) / (2 * L1 * L2)
+    cos_theta2 = (r_sq - L1**2 - L2**2) / (2 * L1 * L2)
+    cos_theta2 = max(-1.0, min(1.0, cos_theta2))  # numerical safety
+    theta2 = math.acos(cos_theta2)
+
+    # Shoulder angle via geometry
+    alpha = math.atan2(y_goal, x_goal)  # angle to goal
+    beta = math.atan2(
+        L2 * math.sin(theta2),
+        L1 + L2 * math.cos(theta2)
+    )  # angle contribution from elbow
+    theta1 = alpha - beta
+
+    return (theta1, theta2)
@@ -0,0 +1,101 @@
+"""
+Shared numeric kernels for 2-DOF arm brains.
+
+Every in-tree brain computes torques through ik_pd_kernel: PD brains pass
+their Kp/Kd, P brains pass their gain as Kp with Kd=0. Keeping one
+implementation means one place to optimize and one place for bugs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Tuple
+
+from ._ik import inverse_kinematics_2dof
+
+
+@dataclass(slots=True)
+class IKCache:
+    """Last IK solution, stored in brain_state["_ik_cache"] and updated in place."""
+    x_goal: float
+    y_goal: float
+    theta1_target: float
+    theta2_target: float
+
+
+def cached_inverse_kinematics(
+    brain_state: dict[str, Any],
+    x_goal: float,
+    y_goal: float,
+    L1: float,
+    L2: float,
+) -> Tuple[float, float]:
+    """
+    inverse_kinematics_2dof with a one-entry cache kept in brain_state.
+
+    The goal only changes when Semantics advances a waypoint, so at 50 Hz
+    nearly every call repeats the previous goal; IK is re-solved only when
+    the goal differs from the cached one.
+
+    Args:
+        brain_state: Brain state dict (IKCache stored under "_ik_cache")
+        x_goal, y_goal: Desired end-effector position in workspace
+        L1, L2: Link lengths
+
+    Returns:
+        (theta1, theta2): Joint angles to reach goal
+    """
+    cache = brain_state.get("_ik_cache")
+    if cache is not None and cache.x_goal == x_goal and cache.y_goal == y_goal:
+        return (cache.theta1_target, cache.theta2_target)
+
+    theta1, theta2 = inverse_kinematics_2dof(x_goal, y_goal, L1, L2)
+    if cache is None:
+        brain_state["_ik_cache"] = IKCache(x_goal, y_goal, theta1, theta2)
+    else:
+        cache.x_goal = x_goal
+        cache.y_goal = y_goal
+        cache.theta1_target = theta1
+        cache.theta2_target = theta2
+    return (theta1, theta2)
+
+
+def ik_pd_kernel(
+    theta1: float,
+    theta2: float,
+    omega1: float,
+    omega2: float,
+    x_goal: float,
+    y_goal: float,
+    L1: float,
+    L2: float,
+    Kp: float,
+    Kd: float,
+    brain_state: dict[str, Any] | None = None,
+) -> Tuple[float, float]:
+    """
+    Workspace goal → joint torques via IK + PD control.
+
+    tau = Kp * (theta_target - theta) - Kd * omega
+
+    Args:
+        theta1, theta2: Current joint angles
+        omega1, omega2: Current joint velocities
+        x_goal, y_goal: Workspace goal
+        L1, L2: Link lengths
+        Kp, Kd: PD gains (Kd=0 gives pure P control)
+        brain_state: If given, IK results are cached in it across calls
+
+    Returns:
+        (tau1, tau2): Proposed joint torques
+    """
+    if brain_state is None:
+        theta1_target, theta2_target = inverse_kinematics_2dof(x_goal, y_goal, L1, L2)
+    else:
+        theta1_target, theta2_target = cached_inverse_kinematics(
+            brain_state, x_goal, y_goal, L1, L2
+        )
+    return (
+        Kp * (theta1_target - theta1) - Kd * omega1,
+        Kp * (theta2_target - theta2) - Kd * omega2,
+    )
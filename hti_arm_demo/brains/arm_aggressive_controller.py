@@ -7,11 +7,22 @@ Shield interventions and demonstrate safety system effectiveness.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Mapping, Any, Tuple
+from typing import Any, Tuple
 
+from hti_arm_demo.shared_state import OBS_IDX, obs_values
 from .base import ArmBrainPolicy
-from .arm_p_controller import inverse_kinematics_2dof
+from ._kernels import ik_pd_kernel
+
+
+# Observation slots (positions in ArmObs.arr, from OBS_IDX)
+_THETA1 = OBS_IDX["theta1"]
+_THETA2 = OBS_IDX["theta2"]
+_OMEGA1 = OBS_IDX["omega1"]
+_OMEGA2 = OBS_IDX["omega2"]
+_X_GOAL = OBS_IDX["x_goal"]
+_Y_GOAL = OBS_IDX["y_goal"]
 
 
 @dataclass
@@ -37,21 +48,15 @@ class ArmAggressiveControllerBrain(ArmBrainPolicy):
         if brain_state is None:
             brain_state = {}
 
-        # Read current state
-        theta1 = obs["theta1"]
-        theta2 = obs["theta2"]
+        arr = obs_values(obs)
 
-        # Read workspace goal
-        x_goal = obs["x_goal"]
-        y_goal = obs["y_goal"]
-
-        # Inverse kinematics
-        theta1_target, theta2_target = inverse_kinematics_2dof(
-            x_goal, y_goal, self.L1, self.L2
+        # IK (cached per goal in brain_state) + aggressive P control
+        # (PD with Kd=0), reading obs by position (OBS_IDX slots)
+        tau1, tau2 = ik_pd_kernel(
+            arr[_THETA1], arr[_THETA2], arr[_OMEGA1], arr[_OMEGA2],
+            arr[_X_GOAL], arr[_Y_GOAL],
+            self.L1, self.L2, self.gain, 0.0,
+            brain_state,
         )
 
-        # Aggressive P control
-        tau1 = self.gain * (theta1_target - theta1)
-        tau2 = self.gain * (theta2_target - theta2)
-
         return ((tau1, tau2), brain_state)
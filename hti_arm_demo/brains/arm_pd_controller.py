@@ -12,77 +12,23 @@ pure P controllers which require high environmental damping to stabilize.
 
 from __future__ import annotations
 
-import math
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Mapping, Any, Tuple
+from typing import Any, Tuple
 
+from hti_arm_demo.shared_state import OBS_IDX, obs_values
 from .base import ArmBrainPolicy
+from ._ik import inverse_kinematics_2dof  # noqa: F401 (re-export)
+from ._kernels import ik_pd_kernel
 
 
-def inverse_kinematics_2dof(
-    x_goal: float,
-    y_goal: float,
-    L1: float,
-    L2: float
-) -> Tuple[float, float]:
-    """
-    Closed-form inverse kinematics for 2-link planar arm.
-
-    Uses standard geometric solution:
-    - Law of cosines for elbow angle (theta2)
-    - Geometry for shoulder angle (theta1)
-
-    Args:
-        x_goal, y_goal: Desired end-effector position in workspace
-        L1, L2: Link lengths
-
-    Returns:
-        (theta1, theta2): Joint angles to reach goal
-
-    Handles edge cases:
-    - Unreachable targets: scaled to workspace boundary
-    - Too-close targets: pushed to minimum reach
-    - Singularities: numerical clamping
-    """
-    # Distance from origin to goal
-    r_sq = x_goal**2 + y_goal**2
-    r = math.sqrt(r_sq)
-
-    # Workspace reachability limits
-    max_reach = L1 + L2
-    min_reach = abs(L1 - L2)
-
-    # Handle unreachable targets
-    if r > max_reach:
-        # Scale goal to workspace boundary
-        scale = max_reach / r
-        x_goal *= scale
-        y_goal *= scale
-        r = max_reach
-        r_sq = r**2
-    elif r < min_reach:
-        # Push outward to minimum reach
-        scale = min_reach / r if r > 1e-6 else 1.0
-        x_goal *= scale
-        y_goal *= scale
-        r = min_reach
-        r_sq = r**2
-
-    # Elbow angle via law of cosines
-    # cos(theta2) = (r^2 - L1^2 - L2^2) / (2 * L1 * L2)
-    cos_theta2 = (r_sq - L1**2 - L2**2) / (2 * L1 * L2)
-    cos_theta2 = max(-1.0, min(1.0, cos_theta2))  # numerical safety
-    theta2 = math.acos(cos_theta2)
-
-    # Shoulder angle via geometry
-    alpha = math.atan2(y_goal, x_goal)  # angle to goal
-    beta = math.atan2(
-        L2 * math.sin(theta2),
-        L1 + L2 * math.cos(theta2)
-    )  # angle contribution from elbow
-    theta1 = alpha - beta
-
-    return (theta1, theta2)
+# Observation slots (positions in ArmObs.arr, from OBS_IDX)
+_THETA1 = OBS_IDX["theta1"]
+_THETA2 = OBS_IDX["theta2"]
+_OMEGA1 = OBS_IDX["omega1"]
+_OMEGA2 = OBS_IDX["omega2"]
+_X_GOAL = OBS_IDX["x_goal"]
+_Y_GOAL = OBS_IDX["y_goal"]
 
 
 @dataclass
@@ -118,25 +64,17 @@ class ArmPDControllerBrain(ArmBrainPolicy):
         if brain_state is None:
             brain_state = {}
 
-        # Read current joint state
-        theta1 = obs["theta1"]
-        theta2 = obs["theta2"]
-        omega1 = obs["omega1"]
-        omega2 = obs["omega2"]
-
-        # Read workspace goal from Semantics
-        x_goal = obs["x_goal"]
-        y_goal = obs["y_goal"]
+        arr = obs_values(obs)
 
-        # Inverse kinematics: workspace → joints
-        theta1_target, theta2_target = inverse_kinematics_2dof(
-            x_goal, y_goal, self.L1, self.L2
-        )
-
-        # PD control in joint space
+        # IK (cached per goal in brain_state) + PD control in joint space,
+        # reading joint state and workspace goal by position (OBS_IDX slots)
         # tau = Kp * error - Kd * velocity
-        tau1 = self.Kp * (theta1_target - theta1) - self.Kd * omega1
-        tau2 = self.Kp * (theta2_target - theta2) - self.Kd * omega2
+        tau1, tau2 = ik_pd_kernel(
+            arr[_THETA1], arr[_THETA2], arr[_OMEGA1], arr[_OMEGA2],
+            arr[_X_GOAL], arr[_Y_GOAL],
+            self.L1, self.L2, self.Kp, self.Kd,
+            brain_state,
+        )
 
         return ((tau1, tau2), brain_state)
 
@@ -6,7 +6,8 @@ Defines the interface that all arm brains must implement.
 
 from __future__ import annotations
 
-from typing import Protocol, Mapping, Any, Tuple
+from collections.abc import Mapping
+from typing import Protocol, Any, Tuple
 
 
 class ArmBrainPolicy(Protocol):
@@ -26,7 +27,10 @@ class ArmBrainPolicy(Protocol):
         Compute joint torques from observation.
 
         Args:
-            obs: Read-only observation dict containing:
+            obs: Read-only observation Mapping by name (usually an ArmObs,
+                which also exposes values by position via obs.arr in
+                OBS_FIELDS order; shared_state.obs_values reads either)
+                containing:
                 - theta1, theta2: current joint angles
                 - omega1, omega2: current joint velocities
                 - x_ee, y_ee: end-effector position
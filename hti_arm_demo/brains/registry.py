@@ -22,7 +22,7 @@ BRAIN_REGISTRY: Dict[str, Type[ArmBrainPolicy]] = {
     "pd": ArmPDControllerBrain,
     "pd_aggressive": ArmAggressivePDControllerBrain,
     "imperfect": ArmImperfectBrain,  # v0.5: mis-tuned PD for stress testing
-    "optimal": ArmOptimalPDBrain,    # Phase 1: critically damped PD (ζ=1.0)
+    "optimal": ArmOptimalPDBrain,    # Phase 1: empirically optimal PD (ζ≈0.636)
 }
 
 
@@ -44,15 +44,14 @@ def create_arm_brain(brain_name: str, config: Dict[str, Any] | None = None) -> A
     Raises:
         ValueError: If brain_name not in registry
     """
-    if brain_name not in BRAIN_REGISTRY:
+    brain_class = BRAIN_REGISTRY.get(brain_name)
+    if brain_class is None:
         available = ", ".join(BRAIN_REGISTRY.keys())
         raise ValueError(
             f"Unknown brain: '{brain_name}'. "
             f"Available: {available}"
         )
 
-    brain_class = BRAIN_REGISTRY[brain_name]
-
     if config is None:
         config = {}
 
@@ -11,7 +11,9 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List
+
+from hti_arm_demo.shared_state import OBS_IDX, ArmObs
 
 
 # Physical constants
@@ -35,8 +37,20 @@ TAU_MAX = 5.0  # max torque magnitude per joint
 
 # Task parameters
 WORKSPACE_TOL = 0.03  # distance tolerance for waypoint reach (meters)
+WORKSPACE_TOL_SQ = WORKSPACE_TOL ** 2  # squared, for sqrt-free reach checks
 MAX_STEPS = 2000  # max ticks per episode
 
+# Observation slots (positions in ArmObs.arr, from OBS_IDX)
+_THETA1 = OBS_IDX["theta1"]
+_THETA2 = OBS_IDX["theta2"]
+_OMEGA1 = OBS_IDX["omega1"]
+_OMEGA2 = OBS_IDX["omega2"]
+_X_EE = OBS_IDX["x_ee"]
+_Y_EE = OBS_IDX["y_ee"]
+_X_GOAL = OBS_IDX["x_goal"]
+_Y_GOAL = OBS_IDX["y_goal"]
+_STAGE_INDEX = OBS_IDX["stage_index"]
+
 # Workspace waypoints (X, Y coordinates in meters)
 WAYPOINTS = [
     (0.7, 0.0),   # A - right
@@ -45,7 +59,7 @@ WAYPOINTS = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ArmState:
     """State of the 2-DOF planar arm."""
     theta1: float  # joint 1 angle [rad]
@@ -84,36 +98,63 @@ def step_dynamics(state: ArmState, tau1: float, tau2: float) -> ArmState:
     Returns:
         New arm state after DT seconds
     """
-    # Clamp input torques to limits
-    tau1 = max(-TAU_MAX, min(TAU_MAX, tau1))
-    tau2 = max(-TAU_MAX, min(TAU_MAX, tau2))
-
-    # Unit inertia: angular acceleration = torque - damping
-    alpha1 = tau1 - DAMPING_COEFF * state.omega1
-    alpha2 = tau2 - DAMPING_COEFF * state.omega2
-
-    # Integrate velocities
-    omega1_next = state.omega1 + DT * alpha1
-    omega2_next = state.omega2 + DT * alpha2
-
-    # Clamp angular velocities
-    omega1_next = max(-OMEGA_MAX, min(OMEGA_MAX, omega1_next))
-    omega2_next = max(-OMEGA_MAX, min(OMEGA_MAX, omega2_next))
-
-    # Integrate positions
-    theta1_next = state.theta1 + DT * omega1_next
-    theta2_next = state.theta2 + DT * omega2_next
-
-    # Clamp joint angles to limits
-    theta1_next = max(THETA_MIN, min(THETA_MAX, theta1_next))
-    theta2_next = max(THETA_MIN, min(THETA_MAX, theta2_next))
-
-    return ArmState(
-        theta1=theta1_next,
-        theta2=theta2_next,
-        omega1=omega1_next,
-        omega2=omega2_next,
+    # The arithmetic lives in _step_kernel (one source of truth)
+    theta1, theta2, omega1, omega2, _, _ = _step_kernel(
+        state.theta1, state.theta2, state.omega1, state.omega2, tau1, tau2
     )
+    return ArmState(theta1=theta1, theta2=theta2, omega1=omega1, omega2=omega2)
+
+
+def _step_kernel(
+    theta1: float,
+    theta2: float,
+    omega1: float,
+    omega2: float,
+    tau1: float,
+    tau2: float,
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Fused per-tick kernel: arm dynamics + forward kinematics on plain floats.
+
+    Unit-inertia model with velocity damping (α = τ - damping * ω), then
+    forward kinematics, in a single call on plain floats. Used by
+    ToyArmEnv.step; step_dynamics wraps it.
+
+    Returns:
+        (theta1, theta2, omega1, omega2, x_ee, y_ee) after DT seconds
+    """
+    # Clamps are written as conditional expressions (no min/max calls) in
+    # min-then-max order: same results as max(lo, min(hi, x)) for every
+    # input, NaN included (→ hi)
+
+    # Clamp input torques to limits
+    tau1 = tau1 if tau1 < TAU_MAX else TAU_MAX
+    tau1 = tau1 if tau1 > -TAU_MAX else -TAU_MAX
+    tau2 = tau2 if tau2 < TAU_MAX else TAU_MAX
+    tau2 = tau2 if tau2 > -TAU_MAX else -TAU_MAX
+
+    # Unit inertia with plant damping, then clamp angular velocities
+    omega1 += DT * (tau1 - DAMPING_COEFF * omega1)
+    omega2 += DT * (tau2 - DAMPING_COEFF * omega2)
+    omega1 = omega1 if omega1 < OMEGA_MAX else OMEGA_MAX
+    omega1 = omega1 if omega1 > -OMEGA_MAX else -OMEGA_MAX
+    omega2 = omega2 if omega2 < OMEGA_MAX else OMEGA_MAX
+    omega2 = omega2 if omega2 > -OMEGA_MAX else -OMEGA_MAX
+
+    # Integrate positions, clamp joint angles to limits
+    theta1 += DT * omega1
+    theta2 += DT * omega2
+    theta1 = theta1 if theta1 < THETA_MAX else THETA_MAX
+    theta1 = theta1 if theta1 > THETA_MIN else THETA_MIN
+    theta2 = theta2 if theta2 < THETA_MAX else THETA_MAX
+    theta2 = theta2 if theta2 > THETA_MIN else THETA_MIN
+
+    # Forward kinematics
+    theta12 = theta1 + theta2
+    x_ee = L1 * math.cos(theta1) + L2 * math.cos(theta12)
+    y_ee = L1 * math.sin(theta1) + L2 * math.sin(theta12)
+
+    return theta1, theta2, omega1, omega2, x_ee, y_ee
 
 
 class ToyArmEnv:
@@ -125,53 +166,79 @@ class ToyArmEnv:
     """
 
     def __init__(self) -> None:
-        self.state: ArmState | None = None
-        self.current_stage: int = 0  # index into WAYPOINTS
+        # Joint state buffer [theta1, theta2, omega1, omega2], updated in
+        # place each tick (None until reset)
+        self._q: List[float] | None = None
+        # Observation returned by reset/step, overwritten in place each tick
+        self._obs = ArmObs()
+        self._stage: int = 0  # index into WAYPOINTS; written only by _set_stage
+        self._goal: Tuple[float, float] = WAYPOINTS[0]  # WAYPOINTS[_stage]
         self.step_count: int = 0
 
-    def reset(self) -> Dict[str, float]:
+    @property
+    def current_stage(self) -> int:
+        """Index of the current waypoint in WAYPOINTS (read-only)."""
+        return self._stage
+
+    @property
+    def state(self) -> ArmState | None:
+        """Snapshot of the current arm state (None before reset)."""
+        if self._q is None:
+            return None
+        return ArmState(*self._q)
+
+    def reset(self) -> ArmObs:
         """
         Reset environment to initial configuration.
 
         Returns:
-            Observation dict with current state and goal
+            Observation with current state and goal (the env's reused
+            ArmObs; copy it to keep a snapshot past the next step)
         """
         # Start with arm somewhat extended
-        self.state = ArmState(
-            theta1=0.0,
-            theta2=0.0,
-            omega1=0.0,
-            omega2=0.0
-        )
-        self.current_stage = 0
+        q = self._q = [0.0, 0.0, 0.0, 0.0]
+        self._set_stage(0)
         self.step_count = 0
-        return self._build_obs()
-
-    def _build_obs(self) -> Dict[str, float]:
-        """Build observation dictionary from current state."""
-        assert self.state is not None, "Environment not initialized"
-
-        # Compute end-effector position
-        x_ee, y_ee = forward_kinematics(self.state.theta1, self.state.theta2)
-
-        # Get current goal
-        x_goal, y_goal = WAYPOINTS[self.current_stage]
-
-        return {
-            "theta1": self.state.theta1,
-            "theta2": self.state.theta2,
-            "omega1": self.state.omega1,
-            "omega2": self.state.omega2,
-            "x_ee": x_ee,
-            "y_ee": y_ee,
-            "x_goal": x_goal,
-            "y_goal": y_goal,
-            "stage_index": float(self.current_stage),
-        }
+        x_ee, y_ee = forward_kinematics(q[0], q[1])
+        return self._build_obs(x_ee, y_ee)
+
+    def _set_stage(self, stage: int) -> None:
+        """
+        Switch to waypoint `stage`: cache its goal and write the goal/stage
+        observation slots, which only change here (not every tick).
+        """
+        self._stage = stage
+        x_goal, y_goal = self._goal = WAYPOINTS[stage]
+
+        arr = self._obs.arr
+        arr[_X_GOAL] = x_goal
+        arr[_Y_GOAL] = y_goal
+        arr[_STAGE_INDEX] = float(stage)
+
+    def _build_obs(self, x_ee: float, y_ee: float) -> ArmObs:
+        """
+        Build fixed-layout observation (see OBS_FIELDS) from current state.
+
+        Overwrites and returns the env's single ArmObs (no per-tick
+        allocation). Goal/stage slots are kept current by _set_stage.
+
+        Args:
+            x_ee, y_ee: End-effector position for the current joint state
+                (step passes the kernel's result, so FK runs once per tick)
+        """
+        q = self._q
+        assert q is not None, "Environment not initialized"
+
+        obs = self._obs
+        arr = obs.arr
+        arr[_THETA1], arr[_THETA2], arr[_OMEGA1], arr[_OMEGA2] = q
+        arr[_X_EE] = x_ee
+        arr[_Y_EE] = y_ee
+        return obs
 
     def step(
         self, tau1: float, tau2: float
-    ) -> Tuple[Dict[str, float], bool, Dict[str, Any]]:
+    ) -> Tuple[ArmObs, bool, Dict[str, Any]]:
         """
         Apply torques and advance simulation by one timestep.
 
@@ -179,36 +246,37 @@ class ToyArmEnv:
             tau1, tau2: Joint torques (after SafetyShield)
 
         Returns:
-            obs: Observation dict
+            obs: Observation (see OBS_FIELDS), same reused ArmObs as reset()
             done: True if episode complete
             info: Additional information dict
         """
-        assert self.state is not None, "Environment not initialized"
+        q = self._q
+        assert q is not None, "Environment not initialized"
 
-        # Integrate dynamics
-        self.state = step_dynamics(self.state, tau1, tau2)
+        # Integrate dynamics + end-effector position (fused kernel)
+        q[0], q[1], q[2], q[3], x_ee, y_ee = _step_kernel(
+            q[0], q[1], q[2], q[3], tau1, tau2
+        )
         self.step_count += 1
 
         # Check waypoint reach
-        x_ee, y_ee = forward_kinematics(self.state.theta1, self.state.theta2)
-        x_goal, y_goal = WAYPOINTS[self.current_stage]
+        x_goal, y_goal = self._goal
 
         dx = x_goal - x_ee
         dy = y_goal - y_ee
-        dist = math.sqrt(dx * dx + dy * dy)
 
         info: Dict[str, Any] = {"stage_advanced": False}
 
         # Check if reached current waypoint
-        if dist <= WORKSPACE_TOL:
-            if self.current_stage < len(WAYPOINTS) - 1:
+        if dx * dx + dy * dy <= WORKSPACE_TOL_SQ:
+            if self._stage < len(WAYPOINTS) - 1:
                 # Advance to next stage
-                self.current_stage += 1
+                self._set_stage(self._stage + 1)
                 info["stage_advanced"] = True
             else:
                 # Final goal reached - success!
                 done = True
-                obs = self._build_obs()
+                obs = self._build_obs(x_ee, y_ee)
                 info["reason"] = "all_waypoints_reached"
                 return obs, done, info
 
@@ -217,5 +285,5 @@ class ToyArmEnv:
         if done:
             info["reason"] = "max_steps"
 
-        obs = self._build_obs()
+        obs = self._build_obs(x_ee, y_ee)
         return obs, done, info
@@ -1,63 +1,121 @@
 """
 Event logging for HTI arm demo.
 
-Writes safety intervention events to JSONL format.
+Writes safety intervention events to JSONL format, streaming each event
+to the file as it is logged (line-buffered, so events survive a crash).
 """
 
 from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, List, TextIO
 
 from hti_arm_demo.shared_state import ArmEventPack
 
 
+def _event_to_dict(event: ArmEventPack) -> Dict[str, Any]:
+    """JSON-ready dict for one event."""
+    return {
+        "timestamp": event.timestamp,
+        "tick": event.tick,
+        "band": event.band,
+        "obs_before": dict(event.obs_before),
+        "action_proposed": list(event.action_proposed),
+        "action_final": list(event.action_final),
+        "reason": event.reason,
+        "metadata": event.metadata,
+    }
+
+
 class EventLogger:
     """
     Simple JSONL logger for safety intervention events.
 
-    Writes events to file and optionally prints to console.
+    Writes each event to file as it is logged (the file is truncated by the
+    first event after construction or clear(); flush()/close() only close
+    it, and later events append) and optionally prints to console. Events are
+    also kept in self.events for post-episode analysis.
+
+    With filepath=None events are only kept in memory (no file). With
+    record=False the logger discards events (no list, file or console
+    output); episode stats still count Shield interventions.
     """
 
-    def __init__(self, filepath: str | Path = "event_log.jsonl", verbose: bool = False):
+    def __init__(
+        self,
+        filepath: str | Path | None = "event_log.jsonl",
+        verbose: bool = False,
+        record: bool = True,
+    ):
         """
         Initialize event logger.
 
         Args:
-            filepath: Path to JSONL output file
-            verbose: If True, print events to console
+            filepath: Path to JSONL output file, or None to keep events
+                in memory only
+            verbose: If True, print events to console (fixed at construction)
+            record: If False, discard all events (fixed at construction)
         """
-        self.filepath = Path(filepath)
+        self.filepath = None if filepath is None else Path(filepath)
         self.verbose = verbose
         self.events: List[ArmEventPack] = []
+        self._fh: TextIO | None = None  # open from first event until close()
+        # The first open after __init__/clear() truncates; later opens append
+        self._truncate = True
+
+        # log is bound per instance to the discard, verbose or quiet path, so
+        # logging an event does not re-test the flags; _record is the quiet
+        # path (list only when filepath is None)
+        self._record: Callable[[ArmEventPack], None] = (
+            self.events.append if filepath is None else self._log_quiet
+        )
+        self.log: Callable[[ArmEventPack], None]
+        if not record:
+            self.log = self._log_discard
+        elif verbose:
+            self.log = self._log_verbose
+        else:
+            self.log = self._record
+
+    def _log_discard(self, event: ArmEventPack) -> None:
+        """Drop event."""
 
-    def log(self, event: ArmEventPack) -> None:
-        """Add event to buffer."""
+    def _log_quiet(self, event: ArmEventPack) -> None:
+        """Record event and write it to the JSONL file."""
         self.events.append(event)
-        if self.verbose:
-            print(f"[Event] tick={event.tick} {event.band}: {event.reason}")
+
+        fh = self._fh
+        if fh is None:
+            fh = self._fh = open(self.filepath, "w" if self._truncate else "a", buffering=1)
+            self._truncate = False
+        fh.write(json.dumps(_event_to_dict(event)) + "\n")
+
+    def _log_verbose(self, event: ArmEventPack) -> None:
+        """Record (and write) event, then print it to console."""
+        self._record(event)
+        print(f"[Event] tick={event.tick} {event.band}: {event.reason}")
+
+    def close(self) -> None:
+        """Close the current file (events are already written)."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
     def flush(self) -> None:
-        """Write all buffered events to file."""
-        if not self.events:
-            return
-
-        with open(self.filepath, "w") as f:
-            for event in self.events:
-                # Convert event to dict
-                event_dict = {
-                    "timestamp": event.timestamp,
-                    "tick": event.tick,
-                    "band": event.band,
-                    "obs_before": event.obs_before,
-                    "action_proposed": list(event.action_proposed),
-                    "action_final": list(event.action_final),
-                    "reason": event.reason,
-                    "metadata": event.metadata,
-                }
-                f.write(json.dumps(event_dict) + "\n")
+        """Finish the current file (events are already written)."""
+        self.close()
+
+    def __enter__(self) -> EventLogger:
+        """Use the logger as a context manager that closes the file on exit."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the file, including when the episode raised."""
+        self.close()
 
     def clear(self) -> None:
-        """Clear event buffer."""
+        """Clear event buffer; the next logged event starts a new file."""
+        self.flush()
         self.events.clear()
+        self._truncate = True
@@ -8,16 +8,20 @@ Runs side-by-side comparison of:
 Demonstrates HTI's value: even badly-tuned brains complete tasks safely,
 but at the cost of more Shield interventions and slower convergence.
 
+Events are aggregated in memory; the demo writes no event_log.jsonl.
+
 Usage:
     python -m hti_arm_demo.run_v05_demo
     python -m hti_arm_demo.run_v05_demo --episodes 20
+    python -m hti_arm_demo.run_v05_demo --episodes 20 --workers 4
 """
 
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 
 from hti_arm_demo.env import ToyArmEnv
 from hti_arm_demo.brains.registry import create_arm_brain
@@ -41,38 +45,32 @@ class BrainMetrics:
     avg_convergence_ticks: float  # mean ticks to complete
 
 
-def run_n_episodes(
-    brain_name: str,
-    n_episodes: int,
-    max_ticks: int = 2000,
-) -> BrainMetrics:
+def _run_episodes(
+    brain_name: str, n_episodes: int, max_ticks: int
+) -> List[Tuple[EpisodeStats, float]]:
     """
-    Run N episodes with specified brain and aggregate metrics.
+    Run episodes back to back, reusing one set of components (module-level
+    so worker processes can pickle it).
 
-    Args:
-        brain_name: Brain to test ("pd" or "imperfect")
-        n_episodes: Number of episodes to run
-        max_ticks: Maximum ticks per episode
+    run_episode resets the env, control band (brain state) and event
+    logger for every episode, so reuse gives the same results as fresh
+    components.
 
     Returns:
-        Aggregated metrics across all episodes
+        Per episode: (stats, clipped_torque), clipped_torque being the sum
+        of |proposed - final| over Shield events
     """
-    # Track results across episodes
-    episode_results: List[EpisodeStats] = []
-    total_clipped_torques: List[float] = []
-    total_reflex_flags: List[int] = []
-
-    for ep in range(n_episodes):
-        # Create fresh components for each episode
-        env = ToyArmEnv()
-        brain = create_arm_brain(brain_name)
-        semantics = SemanticsBand()
-        control = ControlBand(brain, brain_name=brain_name)
-        reflex = ReflexBand()
-        shield = SafetyShield()
-        event_logger = EventLogger(verbose=False)
-
-        # Run episode
+    env = ToyArmEnv()
+    brain = create_arm_brain(brain_name)
+    semantics = SemanticsBand()
+    control = ControlBand(brain, brain_name=brain_name)
+    reflex = ReflexBand()
+    shield = SafetyShield()
+    # Events are aggregated in memory only; no event_log.jsonl is written
+    event_logger = EventLogger(filepath=None, verbose=False)
+
+    results: List[Tuple[EpisodeStats, float]] = []
+    for _ in range(n_episodes):
         stats = run_episode(
             env=env,
             semantics=semantics,
@@ -83,7 +81,6 @@ def run_n_episodes(
             max_ticks=max_ticks,
             verbose=False,
         )
-        episode_results.append(stats)
 
         # Compute clipped torque from events
         clipped_torque = 0.0
@@ -91,13 +88,60 @@ def run_n_episodes(
             tau1_p, tau2_p = event.action_proposed
             tau1_f, tau2_f = event.action_final
             clipped_torque += abs(tau1_p - tau1_f) + abs(tau2_p - tau2_f)
-        total_clipped_torques.append(clipped_torque)
 
-        # Count reflex flags (stub - would need to track in episode)
-        total_reflex_flags.append(0)  # TODO: track if needed
+        results.append((stats, clipped_torque))
+
+    return results
+
+
+def run_n_episodes(
+    brain_name: str,
+    n_episodes: int,
+    max_ticks: int = 2000,
+    workers: int = 1,
+) -> BrainMetrics:
+    """
+    Run N episodes with specified brain and aggregate metrics.
+
+    Episodes are independent, so with workers > 1 they are split across
+    worker processes; each worker builds its components once and reuses
+    them per episode.
+
+    Args:
+        brain_name: Brain to test ("pd" or "imperfect")
+        n_episodes: Number of episodes to run
+        max_ticks: Maximum ticks per episode
+        workers: Worker processes (default 1: run serially in this process)
+
+    Returns:
+        Aggregated metrics across all episodes
+    """
+    # Pool startup dominates for a couple of short episodes
+    if workers <= 1 or n_episodes <= 2:
+        results = _run_episodes(brain_name, n_episodes, max_ticks)
+    else:
+        # One contiguous share of episodes per worker
+        workers = min(workers, n_episodes)
+        shares = [
+            n_episodes // workers + (i < n_episodes % workers)
+            for i in range(workers)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [
+                result
+                for share in pool.map(
+                    _run_episodes, [brain_name] * workers, shares, [max_ticks] * workers
+                )
+                for result in share
+            ]
+
+    # Track results across episodes
+    episode_results: List[EpisodeStats] = [stats for stats, _ in results]
+    total_clipped_torques: List[float] = [clipped for _, clipped in results]
+    total_reflex_flags: List[int] = [0] * n_episodes  # stub - would need to track in episode
 
     # Aggregate metrics
-    success_count = sum(1 for r in episode_results if r.all_waypoints_reached)
+    success_count = sum(r.all_waypoints_reached for r in episode_results)
     success_rate = success_count / n_episodes
 
     avg_interventions = sum(r.shield_interventions for r in episode_results) / n_episodes
@@ -151,12 +195,13 @@ def print_comparison_table(results: dict[str, BrainMetrics]) -> None:
         print("="*70 + "\n")
 
 
-def run_comparison(n_episodes: int = 10) -> dict[str, BrainMetrics]:
+def run_comparison(n_episodes: int = 10, workers: int = 1) -> dict[str, BrainMetrics]:
     """
     Run PD baseline vs Imperfect brain comparison.
 
     Args:
         n_episodes: Number of episodes per brain
+        workers: Worker processes per brain (default 1: serial)
 
     Returns:
         Dict mapping scenario name to metrics
@@ -169,7 +214,7 @@ def run_comparison(n_episodes: int = 10) -> dict[str, BrainMetrics]:
     results = {}
     for name, brain_name in scenarios:
         print(f"\nRunning {name} ({brain_name})...")
-        metrics = run_n_episodes(brain_name, n_episodes)
+        metrics = run_n_episodes(brain_name, n_episodes, workers=workers)
         results[name] = metrics
         print(f"  Completed {n_episodes} episodes")
 
@@ -197,6 +242,13 @@ def main():
         help="Maximum ticks per episode (default: 2000)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes (default: 1, serial)"
+    )
+
     args = parser.parse_args()
 
     print("\n=== HTI v0.5 - Imperfect Brain Stress Test ===")
@@ -205,7 +257,7 @@ def main():
     print("\nThis demonstrates HTI's value: even badly-tuned brains")
     print("complete tasks safely, at the cost of more interventions.")
 
-    run_comparison(n_episodes=args.episodes)
+    run_comparison(n_episodes=args.episodes, workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -13,7 +13,7 @@ Strict ordering per tick: Semantics → Control → Reflex → Shield → env.st
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from hti_arm_demo.env import ToyArmEnv, DT
 from hti_arm_demo.shared_state import ArmSharedState
@@ -33,6 +33,86 @@ class EpisodeStats:
     reason: str  # "all_waypoints_reached" or "max_steps"
 
 
+# Band periods in ticks (100 Hz base rate)
+SEMANTICS_PERIOD = 10  # 10 Hz
+CONTROL_PERIOD = 2     # 50 Hz
+
+
+def _run_banded_loop(
+    state: ArmSharedState,
+    env: ToyArmEnv,
+    semantics: SemanticsBand,
+    control: ControlBand,
+    reflex: ReflexBand,
+    shield: SafetyShield,
+    event_logger: EventLogger,
+    max_ticks: int,
+    verbose: bool,
+) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Tick loop with the band schedule unrolled into nested loops.
+
+    Outer loop: one Semantics period; middle: one Control period; inner:
+    every tick (Reflex → Shield → env.step). Same call order as testing
+    tick % 10 / tick % 2 every tick, without the per-tick tests.
+
+    Returns:
+        (last_tick, info): info is env.step's info if the episode ended
+        (done), else None
+    """
+    # Bind hot-path methods once
+    semantics_step = semantics.step
+    control_step = control.step
+    reflex_step = reflex.step
+    shield_apply = shield.apply
+    log_event = event_logger.log
+    env_step = env.step
+
+    tick = -1
+    for block_start in range(0, max_ticks, SEMANTICS_PERIOD):
+        block_end = min(block_start + SEMANTICS_PERIOD, max_ticks)
+
+        # Semantics band (10 Hz: first tick of block)
+        state.tick = block_start
+        state.t = block_start * DT
+        semantics_step(state)
+
+        for control_start in range(block_start, block_end, CONTROL_PERIOD):
+            # Control band (50 Hz: first tick of control period)
+            state.tick = control_start
+            state.t = control_start * DT
+            control_step(state)
+
+            for tick in range(control_start, min(control_start + CONTROL_PERIOD, block_end)):
+                # Update time
+                state.tick = tick
+                state.t = tick * DT
+
+                # Reflex band (100 Hz: every tick)
+                reflex_step(state)
+
+                # Safety Shield (100 Hz: every tick)
+                shield_apply(state, log_event)
+
+                # Apply final action to environment
+                tau1, tau2 = state.action_final or (0.0, 0.0)
+                obs, done, info = env_step(tau1, tau2)
+
+                # Update state with new observation
+                state.obs = obs
+
+                # Check termination
+                if done:
+                    return tick, info
+
+                if verbose and tick % 100 == 0:
+                    stage = int(obs["stage_index"])
+                    interventions = state.shield_interventions
+                    print(f"Tick {tick}: stage={stage}, interventions={interventions}")
+
+    return tick, None
+
+
 def run_episode(
     env: ToyArmEnv,
     semantics: SemanticsBand,
@@ -71,51 +151,19 @@ def run_episode(
     # Clear event logger
     event_logger.clear()
 
-    # Episode loop
-    done = False
-    all_waypoints_reached = False
-    reason = "max_steps"
-
-    for tick in range(max_ticks):
-        # Update time
-        state.tick = tick
-        state.t = tick * DT
-
-        # Semantics band (10 Hz: every 10 ticks)
-        if tick % 10 == 0:
-            semantics.step(state)
-
-        # Control band (50 Hz: every 2 ticks)
-        if tick % 2 == 0:
-            control.step(state)
-
-        # Reflex band (100 Hz: every tick)
-        reflex.step(state)
-
-        # Safety Shield (100 Hz: every tick)
-        shield.apply(state, event_logger.events)
-
-        # Apply final action to environment
-        tau1, tau2 = state.action_final or (0.0, 0.0)
-        obs, done, info = env.step(tau1, tau2)
-
-        # Update state with new observation
-        state.obs = obs
-
-        # Check termination
-        if done:
-            if info.get("reason") == "all_waypoints_reached":
-                all_waypoints_reached = True
-                reason = "all_waypoints_reached"
-            break
-
-        if verbose and tick % 100 == 0:
-            stage = int(obs["stage_index"])
-            interventions = state.shield_interventions
-            print(f"Tick {tick}: stage={stage}, interventions={interventions}")
-
-    # Write events to file
-    event_logger.flush()
+    # Episode loop (the log file is closed even if a band raises)
+    try:
+        tick, info = _run_banded_loop(
+            state, env, semantics, control, reflex, shield, event_logger,
+            max_ticks, verbose,
+        )
+    finally:
+        event_logger.flush()
+
+    all_waypoints_reached = (
+        info is not None and info.get("reason") == "all_waypoints_reached"
+    )
+    reason = "all_waypoints_reached" if all_waypoints_reached else "max_steps"
 
     return EpisodeStats(
         ticks=tick + 1,
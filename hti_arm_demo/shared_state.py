@@ -6,16 +6,74 @@ These structures are passed between time bands within a single tick.
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+
+# Fixed observation layout: position of each field in ArmObs.arr
+OBS_FIELDS: Tuple[str, ...] = (
+    "theta1",       # 0: joint 1 angle [rad]
+    "theta2",       # 1: joint 2 angle [rad]
+    "omega1",       # 2: joint 1 velocity [rad/s]
+    "omega2",       # 3: joint 2 velocity [rad/s]
+    "x_ee",         # 4: end-effector x [m]
+    "y_ee",         # 5: end-effector y [m]
+    "x_goal",       # 6: current waypoint x [m]
+    "y_goal",       # 7: current waypoint y [m]
+    "stage_index",  # 8: current task stage (as float)
+)
+OBS_IDX: Dict[str, int] = {name: i for i, name in enumerate(OBS_FIELDS)}
+N_OBS_FIELDS = len(OBS_FIELDS)
+
+
+class ArmObs(Mapping[str, float]):
+    """
+    Fixed-layout arm observation.
+
+    Values are stored in a flat list ordered by OBS_FIELDS, so bands on
+    the hot path index by position instead of hashing string keys every
+    tick. Name-based access (obs["theta1"]) is kept for brains and tests.
+    """
+
+    __slots__ = ("arr",)
+
+    def __init__(self, arr: List[float] | None = None) -> None:
+        self.arr: List[float] = [0.0] * N_OBS_FIELDS if arr is None else arr
+
+    def __getitem__(self, key: str) -> float:
+        return self.arr[OBS_IDX[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(OBS_FIELDS)
+
+    def __len__(self) -> int:
+        return N_OBS_FIELDS
 
+    def __repr__(self) -> str:
+        return f"ArmObs({dict(self)!r})"
 
-@dataclass
+
+def obs_values(obs: Mapping[str, float]) -> List[float]:
+    """
+    Observation values in OBS_FIELDS order.
+
+    Returns the backing list of an ArmObs without copying; any other
+    Mapping (e.g. a dict, or an obs_filter result) is read by name.
+    """
+    if type(obs) is ArmObs:
+        return obs.arr
+    return [obs[name] for name in OBS_FIELDS]
+
+
+@dataclass(slots=True)
 class ArmSemanticsAdvice:
     """
     High-level task advice from Semantics band (10 Hz).
 
     Tracks current stage in multi-waypoint task and goal position.
+    SemanticsBand reuses one instance and overwrites it each step, so
+    consumers must read it within the tick rather than keep a reference.
     """
     stage_index: int
     x_goal: float
@@ -23,12 +81,14 @@ class ArmSemanticsAdvice:
     stage_complete: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ArmReflexFlags:
     """
     Fast safety flags from Reflex band (100 Hz).
 
     Detects proximity to joint limits, excessive velocities, and obstacles.
+    ReflexBand reuses one instance and overwrites every field each tick,
+    so consumers must read it within the tick rather than keep a reference.
     """
     # Joint limit proximity
     joint1_near_limit: bool
@@ -44,7 +104,7 @@ class ArmReflexFlags:
     obstacle_distance: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArmEventPack:
     """
     Safety intervention event for logging.
@@ -55,8 +115,8 @@ class ArmEventPack:
     tick: int
     band: str  # which band generated the event
 
-    # State snapshot
-    obs_before: Dict[str, float]
+    # State snapshot (private copy of the observation at intervention time)
+    obs_before: ArmObs
 
     # Action comparison
     action_proposed: Tuple[float, float]  # (tau1, tau2) before Shield
@@ -67,13 +127,15 @@ class ArmEventPack:
     metadata: Dict[str, float | int | bool] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArmSharedState:
     """
     Shared state passed between bands in HTI arm demo.
 
     Updated by each band in strict order:
       Semantics → Control → Reflex → SafetyShield → env.step()
+
+    Slotted: every band reads/writes these attributes each tick.
     """
 
     # Time
@@ -81,7 +143,7 @@ class ArmSharedState:
     t: float = 0.0  # seconds
 
     # Environment observation
-    obs: Dict[str, float] = field(default_factory=dict)
+    obs: ArmObs = field(default_factory=ArmObs)
 
     # Band outputs
     semantics_advice: Optional[ArmSemanticsAdvice] = None
@@ -0,0 +1,7 @@
+"""
+Shared tick budgets for HTI arm demo tests.
+"""
+
+# Episode ceiling for PD tests: about 2x the slowest passing run
+# (nominal PD finishes in ~455 ticks), so a regression fails fast.
+NOMINAL_TICK_BUDGET = 1000
@@ -0,0 +1,64 @@
+"""
+Shared pytest fixtures for HTI arm demo tests.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+
+# Make the repo root importable once per session, before any test module
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from hti_arm_demo.env import ToyArmEnv
+from hti_arm_demo.brains.registry import create_arm_brain
+from hti_arm_demo.bands.semantics import SemanticsBand
+from hti_arm_demo.bands.control import ControlBand
+from hti_arm_demo.bands.reflex import ReflexBand
+from hti_arm_demo.bands.shield import SafetyShield
+from hti_arm_demo.event_log import EventLogger
+from hti_arm_demo.scheduler import EpisodeStats, run_episode
+from hti_arm_demo.tests._budgets import NOMINAL_TICK_BUDGET
+
+
+def _build_harness(brain_name: str, config: Optional[Dict[str, Any]] = None) -> SimpleNamespace:
+    """Fresh env, bands, shield and logger around a registry brain."""
+    brain = create_arm_brain(brain_name, config)
+    return SimpleNamespace(
+        env=ToyArmEnv(),
+        semantics=SemanticsBand(),
+        control=ControlBand(brain, brain_name=brain_name),
+        reflex=ReflexBand(),
+        shield=SafetyShield(),
+        event_logger=EventLogger(record=False),
+    )
+
+
+@pytest.fixture
+def make_harness() -> Callable[..., SimpleNamespace]:
+    """
+    Factory for a fresh HTI harness around a registry brain.
+
+    make_harness(brain_name, config=None) returns a namespace whose fields
+    are run_episode's component arguments:
+
+        h = make_harness("pd")
+        stats = run_episode(**vars(h), max_ticks=NOMINAL_TICK_BUDGET, verbose=False)
+    """
+    return _build_harness
+
+
+@pytest.fixture(scope="session")
+def nominal_pd_stats() -> EpisodeStats:
+    """
+    Stats of one nominal PD episode, shared across tests.
+
+    Safe to share because the episode is deterministic: ToyArmEnv has no
+    randomness and the PD brain is a pure function of the observation, so
+    every rerun would produce identical stats.
+    """
+    return run_episode(
+        **vars(_build_harness("pd")), max_ticks=NOMINAL_TICK_BUDGET, verbose=False
+    )
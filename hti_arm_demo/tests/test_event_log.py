@@ -0,0 +1,52 @@
+"""
+Tests for the arm EventLogger file handling.
+
+Verifies that only construction and clear() start a new JSONL file:
+- flush() mid-run keeps earlier events on disk
+- clear() starts the next episode's file afresh
+"""
+
+from hti_arm_demo.event_log import EventLogger
+from hti_arm_demo.shared_state import ArmEventPack, ArmObs
+
+
+def _event(tick: int) -> ArmEventPack:
+    """Minimal Shield event at the given tick."""
+    return ArmEventPack(
+        timestamp=tick * 0.01,
+        tick=tick,
+        band="SafetyShield",
+        obs_before=ArmObs(),
+        action_proposed=(9.0, 0.0),
+        action_final=(5.0, 0.0),
+        reason="clip_or_scale",
+        metadata={},
+    )
+
+
+def test_flush_then_log_keeps_earlier_events(tmp_path):
+    """log, flush, log, flush leaves both events in the file."""
+    filepath = tmp_path / "events.jsonl"
+    event_logger = EventLogger(filepath=filepath)
+
+    event_logger.log(_event(1))
+    event_logger.flush()
+    event_logger.log(_event(2))
+    event_logger.flush()
+
+    assert len(filepath.read_text().splitlines()) == len(event_logger.events) == 2
+
+
+def test_clear_starts_new_file(tmp_path):
+    """Events logged after clear() replace the previous file's contents."""
+    filepath = tmp_path / "events.jsonl"
+    event_logger = EventLogger(filepath=filepath)
+
+    event_logger.log(_event(1))
+    event_logger.clear()
+    event_logger.log(_event(2))
+    event_logger.flush()
+
+    lines = filepath.read_text().splitlines()
+    assert len(lines) == 1
+    assert '"tick": 2' in lines[0]
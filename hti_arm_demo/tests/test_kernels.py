@@ -0,0 +1,82 @@
+"""
+Tests for the shared numeric kernels (brain IK + PD, env step).
+
+Verifies the fast paths return exactly what the plain computation does:
+- IK cache hits reproduce the uncached solution
+- IK cache refreshes when the goal changes
+- Fused env step kernel matches the min/max reference step (NaN included)
+"""
+
+import math
+
+from hti_arm_demo.brains._ik import inverse_kinematics_2dof
+from hti_arm_demo.brains._kernels import cached_inverse_kinematics, ik_pd_kernel
+from hti_arm_demo.env import (
+    DAMPING_COEFF, DT, OMEGA_MAX, TAU_MAX, THETA_MAX, THETA_MIN,
+    ArmState, _step_kernel, forward_kinematics, step_dynamics,
+)
+
+
+def test_cached_ik_matches_uncached():
+    """Cache hit and miss both return the plain IK solution."""
+    brain_state = {}
+    expected = inverse_kinematics_2dof(0.4, 0.3, 0.6, 0.4)
+
+    assert cached_inverse_kinematics(brain_state, 0.4, 0.3, 0.6, 0.4) == expected
+    assert cached_inverse_kinematics(brain_state, 0.4, 0.3, 0.6, 0.4) == expected
+
+
+def test_cached_ik_refreshes_on_new_goal():
+    """A new goal must not be served from the previous goal's cache entry."""
+    brain_state = {}
+    cached_inverse_kinematics(brain_state, 0.7, 0.0, 0.6, 0.4)
+
+    result = cached_inverse_kinematics(brain_state, 0.3, -0.2, 0.6, 0.4)
+
+    assert result == inverse_kinematics_2dof(0.3, -0.2, 0.6, 0.4)
+
+
+def test_kernel_cache_does_not_change_torques():
+    """ik_pd_kernel gives identical torques with and without the IK cache."""
+    args = (0.1, -0.2, 0.5, -0.3, 0.4, 0.3, 0.6, 0.4, 8.0, 2.0)
+    brain_state = {}
+
+    uncached = ik_pd_kernel(*args)
+
+    assert ik_pd_kernel(*args, brain_state) == uncached
+    assert ik_pd_kernel(*args, brain_state) == uncached
+
+
+def _reference_step(theta1, theta2, omega1, omega2, tau1, tau2):
+    """Plain min/max formulation of one env step (the kernel's specification)."""
+    tau1 = max(-TAU_MAX, min(TAU_MAX, tau1))
+    tau2 = max(-TAU_MAX, min(TAU_MAX, tau2))
+    omega1 = max(-OMEGA_MAX, min(OMEGA_MAX, omega1 + DT * (tau1 - DAMPING_COEFF * omega1)))
+    omega2 = max(-OMEGA_MAX, min(OMEGA_MAX, omega2 + DT * (tau2 - DAMPING_COEFF * omega2)))
+    theta1 = max(THETA_MIN, min(THETA_MAX, theta1 + DT * omega1))
+    theta2 = max(THETA_MIN, min(THETA_MAX, theta2 + DT * omega2))
+    x_ee, y_ee = forward_kinematics(theta1, theta2)
+    return theta1, theta2, omega1, omega2, x_ee, y_ee
+
+
+def test_env_step_kernel_matches_reference():
+    """Fused step kernel is bit-identical to the min/max reference step."""
+    # In range, saturating torque, clamped-velocity/angle and non-finite
+    # torque cases
+    cases = [
+        (0.1, -0.2, 0.5, -0.3, 1.0, -2.0),
+        (3.1, -3.1, 3.99, -3.99, 9.0, -9.0),
+        (0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+        (0.1, -0.2, 0.5, -0.3, math.nan, -math.inf),
+    ]
+    for case in cases:
+        assert _step_kernel(*case) == _reference_step(*case)
+
+
+def test_step_dynamics_wraps_kernel():
+    """step_dynamics returns the kernel's joint state as an ArmState."""
+    theta1, theta2, omega1, omega2, _, _ = _step_kernel(0.1, -0.2, 0.5, -0.3, 1.0, -2.0)
+
+    state = step_dynamics(ArmState(0.1, -0.2, 0.5, -0.3), 1.0, -2.0)
+
+    assert state == ArmState(theta1, theta2, omega1, omega2)
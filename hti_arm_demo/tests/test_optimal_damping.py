@@ -16,6 +16,27 @@ from hti_arm_demo.bands.shield import SafetyShield
 from hti_arm_demo.event_log import EventLogger
 from hti_arm_demo.scheduler import run_episode
 from hti_arm_demo.brains import create_arm_brain
+from hti_arm_demo.batch_sweep import sweep_pd_gains
+
+
+def _run_episode_ticks(brain_name: str, num_runs: int, max_ticks: int = 1000) -> list[int]:
+    """
+    Run episodes with one set of components, returning ticks per episode.
+
+    run_episode resets env, control band and logger each episode, so the
+    components are built once and reused.
+    """
+    env = ToyArmEnv()
+    semantics = SemanticsBand()
+    control = ControlBand(create_arm_brain(brain_name))
+    reflex = ReflexBand()
+    shield = SafetyShield()
+    logger = EventLogger(record=False)
+
+    return [
+        run_episode(env, semantics, control, reflex, shield, logger, max_ticks=max_ticks).ticks
+        for _ in range(num_runs)
+    ]
 
 
 class TestOptimalDamping(unittest.TestCase):
@@ -34,33 +55,8 @@ class TestOptimalDamping(unittest.TestCase):
         """
         NUM_RUNS = 5
 
-        # Run nominal PD
-        nominal_ticks = []
-        for _ in range(NUM_RUNS):
-            env = ToyArmEnv()
-            brain = create_arm_brain("pd")  # Kd=2.0
-            semantics = SemanticsBand()
-            control = ControlBand(brain)
-            reflex = ReflexBand()
-            shield = SafetyShield()
-            logger = EventLogger(verbose=False)
-
-            stats = run_episode(env, semantics, control, reflex, shield, logger, max_ticks=1000)
-            nominal_ticks.append(stats.ticks)
-
-        # Run optimal PD
-        optimal_ticks = []
-        for _ in range(NUM_RUNS):
-            env = ToyArmEnv()
-            brain = create_arm_brain("optimal")  # Kd=3.5
-            semantics = SemanticsBand()
-            control = ControlBand(brain)
-            reflex = ReflexBand()
-            shield = SafetyShield()
-            logger = EventLogger(verbose=False)
-
-            stats = run_episode(env, semantics, control, reflex, shield, logger, max_ticks=1000)
-            optimal_ticks.append(stats.ticks)
+        nominal_ticks = _run_episode_ticks("pd", NUM_RUNS)  # Kd=2.0
+        optimal_ticks = _run_episode_ticks("optimal", NUM_RUNS)  # Kd=3.5
 
         avg_nominal = sum(nominal_ticks) / len(nominal_ticks)
         avg_optimal = sum(optimal_ticks) / len(optimal_ticks)
@@ -89,7 +85,7 @@ class TestOptimalDamping(unittest.TestCase):
         control = ControlBand(brain)
         reflex = ReflexBand()
         shield = SafetyShield()
-        logger = EventLogger(verbose=False)
+        logger = EventLogger(record=False)
 
         stats = run_episode(env, semantics, control, reflex, shield, logger, max_ticks=1000)
 
@@ -116,6 +112,22 @@ class TestOptimalDamping(unittest.TestCase):
         zeta = (brain.Kd + 0.1) / (2 * (brain.Kp ** 0.5))
         self.assertAlmostEqual(zeta, 0.636, places=2, msg="Optimal damping ratio should be ~0.636")
 
+    def test_gain_sweep_matches_grid_search(self):
+        """
+        Parallel Kd sweep should reproduce the grid search ranking.
+
+        Serial and parallel runs must agree (episodes are deterministic).
+        """
+        kd_values = [2.0, 3.5]
+
+        serial = sweep_pd_gains(kd_values, workers=1)
+        parallel = sweep_pd_gains(kd_values, workers=2)
+
+        self.assertEqual(serial, parallel, "Parallel sweep should match serial sweep")
+        self.assertEqual([r.Kd for r in serial], kd_values)
+        self.assertTrue(all(r.all_waypoints_reached for r in serial))
+        self.assertLess(serial[1].ticks, serial[0].ticks, "Kd=3.5 should beat Kd=2.0")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,52 @@
+"""
+Tests for the arm SafetyShield band.
+
+Verifies the Shield's output contract directly, without running episodes:
+- action_final always lies within [u_min, u_max], even for NaN/inf input
+- near_limit_scale is read on every call (reassignment takes effect)
+"""
+
+import math
+
+import pytest
+
+from hti_arm_demo.bands.shield import SafetyShield
+from hti_arm_demo.env import TAU_MAX
+from hti_arm_demo.shared_state import ArmReflexFlags, ArmSharedState
+
+
+@pytest.mark.parametrize("proposed,expected", [
+    ((math.nan, 1.0), (TAU_MAX, 1.0)),
+    ((1.0, math.nan), (1.0, TAU_MAX)),
+    ((math.inf, -math.inf), (TAU_MAX, -TAU_MAX)),
+])
+def test_non_finite_torques_clipped_to_bounds(proposed, expected):
+    """Non-finite torques map to a bound (as max(u_min, min(u_max, v))) and are logged."""
+    state = ArmSharedState(action_proposed=proposed)
+    events = []
+
+    SafetyShield().apply(state, events.append)
+
+    assert state.action_final == expected
+    assert len(events) == 1, "Clipping a non-finite torque must log an event"
+
+
+def test_near_limit_scale_reassignment_applies():
+    """Changing near_limit_scale after construction changes the scaling."""
+    shield = SafetyShield()
+    shield.near_limit_scale = 0.25
+    state = ArmSharedState(
+        reflex_flags=ArmReflexFlags(
+            joint1_near_limit=True,
+            joint2_near_limit=False,
+            joint1_distance_to_limit=0.01,
+            joint2_distance_to_limit=1.0,
+            joints_too_fast=True,
+            near_obstacle=False,
+        ),
+        action_proposed=(1.0, -1.0),
+    )
+
+    shield.apply(state, [].append)
+
+    assert state.action_final == (0.0625, -0.0625)
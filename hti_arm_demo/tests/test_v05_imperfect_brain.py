@@ -8,14 +8,59 @@ Tests the mis-tuned brain implementation and validates that:
 4. EventPack metadata contains brain_name
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
 from hti_arm_demo.env import ToyArmEnv
 from hti_arm_demo.brains.registry import create_arm_brain
+from hti_arm_demo.brains.arm_imperfect import ArmImperfectBrain
 from hti_arm_demo.bands.semantics import SemanticsBand
 from hti_arm_demo.bands.control import ControlBand
 from hti_arm_demo.bands.reflex import ReflexBand
 from hti_arm_demo.bands.shield import SafetyShield
 from hti_arm_demo.event_log import EventLogger
-from hti_arm_demo.scheduler import run_episode
+from hti_arm_demo.scheduler import run_episode, EpisodeStats
+
+
+def _run_one_episode(brain_name: str, max_ticks: int) -> EpisodeStats:
+    """Run one episode with fresh components (module-level so workers can pickle it)."""
+    brain = create_arm_brain(brain_name)
+    return run_episode(
+        env=ToyArmEnv(),
+        semantics=SemanticsBand(),
+        control=ControlBand(brain, brain_name=brain_name),
+        reflex=ReflexBand(),
+        shield=SafetyShield(),
+        event_logger=EventLogger(record=False),  # workers write no event file
+        max_ticks=max_ticks,
+        verbose=False,
+    )
+
+
+def _run_batches_parallel(*batches: tuple[str, int, int]) -> list[list[EpisodeStats]]:
+    """
+    Run (brain_name, n, max_ticks) batches concurrently in one worker pool.
+
+    Returns one list of stats per batch, in batch order.
+    """
+    names = [name for name, n, _ in batches for _ in range(n)]
+    ticks = [max_ticks for _, n, max_ticks in batches for _ in range(n)]
+    with ProcessPoolExecutor(max_workers=min(len(names), os.cpu_count() or 1)) as pool:
+        results = list(pool.map(_run_one_episode, names, ticks))
+
+    grouped = []
+    start = 0
+    for _, n, _ in batches:
+        grouped.append(results[start:start + n])
+        start += n
+    return grouped
+
+
+def _run_episodes_parallel(brain_name: str, n: int, max_ticks: int) -> list[EpisodeStats]:
+    """Run n independent episodes across worker processes."""
+    return _run_batches_parallel((brain_name, n, max_ticks))[0]
 
 
 def test_pd_baseline_still_works():
@@ -33,7 +78,7 @@ def test_pd_baseline_still_works():
     control = ControlBand(brain, brain_name="pd")
     reflex = ReflexBand()
     shield = SafetyShield()
-    event_logger = EventLogger(verbose=False)
+    event_logger = EventLogger(record=False)
 
     stats = run_episode(
         env=env,
@@ -61,51 +106,13 @@ def test_imperfect_stresses_shield_more():
     """
     n = 3
 
-    # Run PD baseline
-    pd_interventions = []
-    for _ in range(n):
-        env = ToyArmEnv()
-        brain = create_arm_brain("pd")
-        semantics = SemanticsBand()
-        control = ControlBand(brain, brain_name="pd")
-        reflex = ReflexBand()
-        shield = SafetyShield()
-        event_logger = EventLogger(verbose=False)
-
-        stats = run_episode(
-            env=env,
-            semantics=semantics,
-            control=control,
-            reflex=reflex,
-            shield=shield,
-            event_logger=event_logger,
-            max_ticks=1000,
-            verbose=False,
-        )
-        pd_interventions.append(stats.shield_interventions)
-
-    # Run Imperfect brain
-    imperfect_interventions = []
-    for _ in range(n):
-        env = ToyArmEnv()
-        brain = create_arm_brain("imperfect")
-        semantics = SemanticsBand()
-        control = ControlBand(brain, brain_name="imperfect")
-        reflex = ReflexBand()
-        shield = SafetyShield()
-        event_logger = EventLogger(verbose=False)
-
-        stats = run_episode(
-            env=env,
-            semantics=semantics,
-            control=control,
-            reflex=reflex,
-            shield=shield,
-            event_logger=event_logger,
-            max_ticks=2000,  # More time for imperfect brain
-            verbose=False,
-        )
-        imperfect_interventions.append(stats.shield_interventions)
+    # Run PD baseline and Imperfect brain together (more time for imperfect brain)
+    pd_results, imperfect_results = _run_batches_parallel(
+        ("pd", n, 1000),
+        ("imperfect", n, 2000),
+    )
+    pd_interventions = [stats.shield_interventions for stats in pd_results]
+    imperfect_interventions = [stats.shield_interventions for stats in imperfect_results]
 
     avg_pd = sum(pd_interventions) / n
     avg_imperfect = sum(imperfect_interventions) / n
@@ -124,30 +131,11 @@ def test_imperfect_still_succeeds_under_hti():
     Asserts: success_rate == 1.0 (all complete despite poor tuning)
     """
     n = 10
-    results = []
-
-    for _ in range(n):
-        env = ToyArmEnv()
-        brain = create_arm_brain("imperfect")
-        semantics = SemanticsBand()
-        control = ControlBand(brain, brain_name="imperfect")
-        reflex = ReflexBand()
-        shield = SafetyShield()
-        event_logger = EventLogger(verbose=False)
-
-        stats = run_episode(
-            env=env,
-            semantics=semantics,
-            control=control,
-            reflex=reflex,
-            shield=shield,
-            event_logger=event_logger,
-            max_ticks=2000,  # Generous timeout for imperfect brain
-            verbose=False,
-        )
-        results.append(stats)
 
-    success_count = sum(1 for r in results if r.all_waypoints_reached)
+    # Generous timeout for imperfect brain
+    results = _run_episodes_parallel("imperfect", n, max_ticks=2000)
+
+    success_count = sum(r.all_waypoints_reached for r in results)
     success_rate = success_count / n
 
     assert success_rate == 1.0, \
@@ -194,6 +182,83 @@ def test_eventpack_metadata_contains_brain_name():
     print(f"✓ EventPack metadata: {len(events)} events, all have brain_name='imperfect'")
 
 
+def test_registry_builds_imperfect_brain_class():
+    """create_arm_brain("imperfect") returns an ArmImperfectBrain with its gains."""
+    brain = create_arm_brain("imperfect")
+    assert type(brain) is ArmImperfectBrain
+    assert (brain.Kp, brain.Kd) == (14.0, 0.5)
+
+
+def test_unrecorded_logger_still_counts_interventions(tmp_path):
+    """EventLogger(record=False) drops events but stats still count interventions."""
+    filepath = tmp_path / "events.jsonl"
+    event_logger = EventLogger(filepath=filepath, record=False)
+
+    stats = run_episode(
+        env=ToyArmEnv(),
+        semantics=SemanticsBand(),
+        control=ControlBand(create_arm_brain("imperfect"), brain_name="imperfect"),
+        reflex=ReflexBand(),
+        shield=SafetyShield(),
+        event_logger=event_logger,
+        max_ticks=500,
+        verbose=False,
+    )
+
+    assert stats.shield_interventions > 0, "No Shield interventions triggered"
+    assert event_logger.events == [], "Unrecorded logger kept events"
+    assert not filepath.exists(), "Unrecorded logger wrote an event file"
+
+
+def test_memory_only_logger_keeps_events(tmp_path, monkeypatch):
+    """EventLogger(filepath=None) keeps events in memory and writes no file."""
+    monkeypatch.chdir(tmp_path)
+    event_logger = EventLogger(filepath=None)
+
+    stats = run_episode(
+        env=ToyArmEnv(),
+        semantics=SemanticsBand(),
+        control=ControlBand(create_arm_brain("imperfect"), brain_name="imperfect"),
+        reflex=ReflexBand(),
+        shield=SafetyShield(),
+        event_logger=event_logger,
+        max_ticks=500,
+        verbose=False,
+    )
+
+    assert len(event_logger.events) == stats.shield_interventions > 0
+    assert list(tmp_path.iterdir()) == [], "Memory-only logger wrote a file"
+
+
+def test_event_file_complete_when_episode_raises(tmp_path):
+    """Events logged before a mid-episode exception are on disk."""
+
+    class FailingReflexBand(ReflexBand):
+        def step(self, state):
+            if state.tick == 300:
+                raise RuntimeError("band failure")
+            super().step(state)
+
+    filepath = tmp_path / "events.jsonl"
+    event_logger = EventLogger(filepath=filepath)
+
+    with pytest.raises(RuntimeError):
+        run_episode(
+            env=ToyArmEnv(),
+            semantics=SemanticsBand(),
+            control=ControlBand(create_arm_brain("imperfect"), brain_name="imperfect"),
+            reflex=FailingReflexBand(),
+            shield=SafetyShield(),
+            event_logger=event_logger,
+            max_ticks=500,
+            verbose=False,
+        )
+
+    assert len(event_logger.events) > 0, "No Shield interventions before the failure"
+    lines = filepath.read_text().splitlines()
+    assert len(lines) == len(event_logger.events), "Logged events missing from file"
+
+
 if __name__ == "__main__":
     # Run all tests
     print("\n=== HTI v0.5 Tests ===\n")
@@ -36,22 +36,18 @@ class ControlBand:
             state: Shared state (modified in-place)
         """
         # v0.2: Use MEASURED state (potentially corrupted by glitches)
-        # Fallback to "x" for backward compatibility with v0.1.1
-        # TODO v0.2: Use direct dict access state.obs["x_meas"] to fail fast on malformed obs
-        x = state.obs.get("x_meas", state.obs.get("x", 0.0))
-        x_target = state.obs.get("x_target", 0.0)
+        obs = state.obs
+        x = obs.x_meas
+        x_target = obs.x_target
 
         error = x_target - x
 
         # Simple proportional control
         action = self.gain * error
 
-        # Consider semantic advice for confidence scaling
-        if state.semantics_advice.confidence > 0.7:
-            # High confidence - use full gain
-            pass
-        elif state.semantics_advice.confidence < 0.3:
-            # Low confidence - reduce aggressiveness
+        # Consider semantic advice for confidence scaling:
+        # low confidence halves aggressiveness, otherwise full gain
+        if state.semantics_advice.confidence < 0.3:
             action *= 0.5
 
         # Propose action (may be out of bounds - Shield will clip)
@@ -4,7 +4,7 @@ Analyzes proposed actions and sets warning flags.
 Does NOT modify the action - only provides flags for Shield.
 """
 
-from hti_v0_demo.shared_state import SharedState, ReflexFlags
+from hti_v0_demo.shared_state import SharedState
 
 
 class ReflexBand:
@@ -18,7 +18,9 @@ class ReflexBand:
         self,
         boundary_margin: float = 0.1,
         speed_threshold: float = 0.08,
-        mismatch_threshold: float = 0.05  # v0.2
+        mismatch_threshold: float = 0.05,  # v0.2
+        lower: float = 0.0,
+        upper: float = 1.0
     ):
         """Initialize reflex band.
 
@@ -26,35 +28,46 @@ class ReflexBand:
             boundary_margin: Distance from boundary considered "near"
             speed_threshold: Action magnitude considered "too fast"
             mismatch_threshold: |x_true - x_meas| considered a sensor fault (v0.2)
+            lower: Lower environment bound on x
+            upper: Upper environment bound on x
+
+        Raises:
+            ValueError: If lower > upper
         """
+        if lower > upper:
+            raise ValueError(f"lower ({lower}) must be <= upper ({upper})")
         self.boundary_margin = boundary_margin
         self.speed_threshold = speed_threshold
         self.mismatch_threshold = mismatch_threshold
+        self.lower = lower
+        self.upper = upper
 
     def step(self, state: SharedState) -> None:
         """Check proposed action against current state.
 
         Reads: state.obs, state.action_proposed
-        Writes: state.reflex_flags (COMPLETELY REPLACES previous flags)
+        Writes: state.reflex_flags (OVERWRITES every field in place)
         MUST NOT write: state.action_proposed, state.action_final
 
         Args:
             state: Shared state (modified in-place)
         """
-        # v0.2: Use x_true for boundary checks (ground truth), fallback to x
-        x_true = state.obs.get("x_true", state.obs.get("x", 0.0))
+        # v0.2: Use x_true for boundary checks (ground truth)
+        obs = state.obs
+        x_true = obs.x_true
 
         # v0.2.1: Use x_meas_raw (unclipped) for mismatch detection
         # This prevents boundary clipping from masking large sensor faults
-        x_meas_raw = state.obs.get("x_meas_raw", state.obs.get("x_meas", state.obs.get("x", 0.0)))
+        x_meas_raw = obs.x_meas_raw
 
-        action = state.action_proposed if state.action_proposed is not None else 0.0
+        action = state.action_proposed
+        if action is None:
+            action = 0.0
 
         # Check proximity to boundaries (using TRUE state)
-        # TODO v0.2: Parameterize env bounds instead of hardcoding 0.0/1.0
-        dist_to_lower = x_true - 0.0
-        dist_to_upper = 1.0 - x_true
-        distance_to_boundary = min(dist_to_lower, dist_to_upper)
+        dist_to_lower = x_true - self.lower
+        dist_to_upper = self.upper - x_true
+        distance_to_boundary = dist_to_upper if dist_to_upper < dist_to_lower else dist_to_lower
 
         near_boundary = distance_to_boundary < self.boundary_margin
 
@@ -67,11 +80,10 @@ class ReflexBand:
         mismatch_magnitude = abs(x_true - x_meas_raw)
         sensor_mismatch = mismatch_magnitude > self.mismatch_threshold
 
-        # REPLACE flags (stateless - Zen MCP #2)
-        state.reflex_flags = ReflexFlags(
-            near_boundary=near_boundary,
-            too_fast=too_fast,
-            distance_to_boundary=distance_to_boundary,
-            sensor_mismatch=sensor_mismatch,
-            mismatch_magnitude=mismatch_magnitude
-        )
+        # OVERWRITE all flags (stateless - Zen MCP #2)
+        flags = state.reflex_flags
+        flags.near_boundary = near_boundary
+        flags.too_fast = too_fast
+        flags.distance_to_boundary = distance_to_boundary
+        flags.sensor_mismatch = sensor_mismatch
+        flags.mismatch_magnitude = mismatch_magnitude
@@ -3,7 +3,7 @@
 ADVISORY ONLY: Cannot set action_proposed or action_final.
 """
 
-from hti_v0_demo.shared_state import SharedState, SemanticsAdvice
+from hti_v0_demo.shared_state import SharedState
 
 
 class SemanticsBand:
@@ -22,28 +22,28 @@ class SemanticsBand:
         Args:
             state: Shared state (modified in-place)
         """
-        # TODO v0.2: Use direct dict access state.obs["x"] to fail fast on malformed obs
-        x = state.obs.get("x", 0.0)
-        x_target = state.obs.get("x_target", 0.0)
+        obs = state.obs
+        x = obs.x
+        x_target = obs.x_target
 
         error = x_target - x
+        abs_error = abs(error)
 
         # Simple heuristic: suggest direction
-        if abs(error) < 0.05:
+        if abs_error < 0.05:
             # Close to target
             direction_hint = 0
             confidence = 0.9
         elif error > 0:
             # Target is to the right
             direction_hint = 1
-            confidence = min(0.5 + abs(error), 1.0)
+            confidence = min(0.5 + abs_error, 1.0)
         else:
             # Target is to the left
             direction_hint = -1
-            confidence = min(0.5 + abs(error), 1.0)
+            confidence = min(0.5 + abs_error, 1.0)
 
         # Update advisory output (NOT action)
-        state.semantics_advice = SemanticsAdvice(
-            direction_hint=direction_hint,
-            confidence=confidence
-        )
+        advice = state.semantics_advice
+        advice.direction_hint = direction_hint
+        advice.confidence = confidence
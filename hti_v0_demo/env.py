@@ -3,6 +3,28 @@
 A minimal environment to demonstrate the harness pattern, not control performance.
 """
 
+from dataclasses import dataclass
+
+from hti_v0_demo.shared_state import Obs
+
+
+@dataclass(slots=True)
+class StepInfo:
+    """Per-step diagnostics returned by ToyEnv.step.
+
+    Attributes:
+        step_count: Steps taken since reset
+        distance: |x - x_target| (true state)
+        success: True if distance < success_threshold
+        glitch_active: True if a sensor glitch is active this step (v0.2)
+        sensor_mismatch: True if measured and true state differ (v0.2)
+    """
+    step_count: int = 0
+    distance: float = 0.0
+    success: bool = False
+    glitch_active: bool = False
+    sensor_mismatch: bool = False
+
 
 class ToyEnv:
     """1D position control environment.
@@ -49,8 +71,11 @@ class ToyEnv:
         self.glitch_end_tick = glitch_end_tick
         self.glitch_magnitude = glitch_magnitude
         self.current_tick = 0
+        # Observation and info objects reused (overwritten in place)
+        self._obs = Obs()
+        self._info = StepInfo()
 
-    def reset(self, x0: float = 0.1, x_target: float = 0.8) -> dict[str, float]:
+    def reset(self, x0: float = 0.1, x_target: float = 0.8) -> Obs:
         """Reset environment to initial state.
 
         Args:
@@ -58,7 +83,8 @@ class ToyEnv:
             x_target: Goal position
 
         Returns:
-            Initial observation dict with keys 'x' and 'x_target'
+            Initial observation (all position fields equal to x0). The same
+            object is returned and overwritten by every reset/step.
 
         Raises:
             ValueError: If x0 or x_target are outside valid range [0.0, 1.0]
@@ -74,66 +100,70 @@ class ToyEnv:
         self.current_tick = 0  # v0.2: Reset tick counter
 
         # v0.2.1: Return x_true, x_meas, and x_meas_raw (all initially identical)
-        return {
-            "x": self.x,              # Backward compatibility
-            "x_true": self.x,         # v0.2: Ground truth
-            "x_meas": self.x,         # v0.2: Measured (initially accurate, clipped)
-            "x_meas_raw": self.x,     # v0.2.1: Unclipped measurement (initially accurate)
-            "x_target": self.x_target
-        }
-
-    def step(self, u: float) -> tuple[dict[str, float], float, bool, dict]:
+        obs = self._obs
+        obs.x = self.x             # Backward compatibility
+        obs.x_true = self.x        # v0.2: Ground truth
+        obs.x_meas = self.x        # v0.2: Measured (initially accurate, clipped)
+        obs.x_meas_raw = self.x    # v0.2.1: Unclipped measurement (initially accurate)
+        obs.x_target = self.x_target
+        return obs
+
+    def step(self, u: float) -> tuple[Obs, float, bool, StepInfo]:
         """Execute one environment step.
 
         Args:
             u: Action (delta-position), already bounded by Shield
 
         Returns:
-            obs: {"x": float, "x_target": float}
+            obs: Obs with true, measured and target positions (reused object)
             reward: Negative distance to target
             done: True if goal reached or max steps exceeded
-            info: Additional information dict
+            info: StepInfo diagnostics (reused object)
         """
         # Apply action to TRUE state (already bounded by Shield)
-        self.x = max(0.0, min(1.0, self.x + u))
+        # Clamps are written as conditionals: same result as
+        # max(0.0, min(1.0, v)) without two builtin calls per clamp.
+        x = self.x + u
+        x = x if x < 1.0 else 1.0
+        x = x if x > 0.0 else 0.0
+        self.x = x
         self.step_count += 1
         self.current_tick += 1  # v0.2: Increment tick counter
 
         # v0.2: Compute measured state with optional glitch
         # v0.2.1: Keep BOTH raw (unclipped) and clipped measurements
-        x_meas_raw = self.x  # Default: measurement matches reality (unclipped)
-        if self.enable_glitches:
-            if self.glitch_start_tick <= self.current_tick < self.glitch_end_tick:
-                # Deterministic glitch: add fixed offset (UNCLIPPED)
-                x_meas_raw = self.x + self.glitch_magnitude
+        glitch_active = (self.enable_glitches and
+                         self.glitch_start_tick <= self.current_tick < self.glitch_end_tick)
+        x_meas_raw = x  # Default: measurement matches reality (unclipped)
+        if glitch_active:
+            # Deterministic glitch: add fixed offset (UNCLIPPED)
+            x_meas_raw = x + self.glitch_magnitude
 
         # Clipped measurement for downstream consumers (ControlBand)
-        x_meas = max(0.0, min(1.0, x_meas_raw))
+        x_meas = x_meas_raw if x_meas_raw < 1.0 else 1.0
+        x_meas = x_meas if x_meas > 0.0 else 0.0
 
         # Observation (v0.2.1: includes x_true, x_meas, and x_meas_raw)
-        obs = {
-            "x": self.x,              # Backward compatibility (uses true state)
-            "x_true": self.x,         # v0.2: Ground truth
-            "x_meas": x_meas,         # v0.2: Measured (potentially corrupted, clipped)
-            "x_meas_raw": x_meas_raw, # v0.2.1: Unclipped measurement for safety checks
-            "x_target": self.x_target
-        }
-
-        # Reward based on TRUE state
-        reward = -abs(self.x - self.x_target)
-
-        # Done condition based on TRUE state
-        distance = abs(self.x - self.x_target)
-        done = (distance < self.success_threshold) or (self.step_count >= self.max_steps)
+        x_target = self.x_target
+        obs = self._obs
+        obs.x = x                  # Backward compatibility (uses true state)
+        obs.x_true = x             # v0.2: Ground truth
+        obs.x_meas = x_meas        # v0.2: Measured (potentially corrupted, clipped)
+        obs.x_meas_raw = x_meas_raw  # v0.2.1: Unclipped measurement for safety checks
+        obs.x_target = x_target
+
+        # Reward and done condition based on TRUE state
+        distance = abs(x - x_target)
+        reward = -distance
+        success = distance < self.success_threshold
+        done = success or (self.step_count >= self.max_steps)
 
         # Info (v0.2: includes glitch status)
-        info = {
-            "step_count": self.step_count,
-            "distance": distance,
-            "success": distance < self.success_threshold,
-            "glitch_active": (self.enable_glitches and
-                             self.glitch_start_tick <= self.current_tick < self.glitch_end_tick),
-            "sensor_mismatch": abs(self.x - x_meas) > 1e-6
-        }
+        info = self._info
+        info.step_count = self.step_count
+        info.distance = distance
+        info.success = success
+        info.glitch_active = glitch_active
+        info.sensor_mismatch = abs(x - x_meas) > 1e-6
 
         return obs, reward, done, info
@@ -4,12 +4,14 @@ Logs safety interventions as EventPacks in JSONL format.
 """
 
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, TextIO
 
+from hti_v0_demo.shared_state import Obs
 
-@dataclass
+
+@dataclass(slots=True)
 class EventPack:
     """Record of a safety intervention by the Shield.
 
@@ -26,17 +28,39 @@ class EventPack:
     timestamp: float
     tick: int
     band: str
-    obs_before: dict[str, float]
+    obs_before: Obs
     action_proposed: float
     action_final: float
     reason: str
     metadata: dict[str, Any]
 
 
+def _event_to_dict(event: EventPack) -> dict[str, Any]:
+    """JSON-ready dict for one event (same keys and order as asdict)."""
+    obs = event.obs_before
+    return {
+        "timestamp": event.timestamp,
+        "tick": event.tick,
+        "band": event.band,
+        "obs_before": {
+            "x": obs.x,
+            "x_true": obs.x_true,
+            "x_meas": obs.x_meas,
+            "x_meas_raw": obs.x_meas_raw,
+            "x_target": obs.x_target,
+        },
+        "action_proposed": event.action_proposed,
+        "action_final": event.action_final,
+        "reason": event.reason,
+        "metadata": event.metadata,
+    }
+
+
 class EventLogger:
     """Logs EventPacks to JSONL file and provides summary statistics.
 
-    Writes each event immediately (no buffering) to event_log.jsonl.
+    Writes each event immediately to event_log.jsonl through one
+    line-buffered handle, so every event reaches the OS as it is logged.
     Tracks statistics for console summary.
     """
 
@@ -49,6 +73,7 @@ class EventLogger:
         self.log_path = Path(log_path)
         self.events: list[EventPack] = []
         self.reason_counts: dict[str, int] = {}
+        self._fh: Optional[TextIO] = None  # opened by the first event
 
         # Clear log file at start
         if self.log_path.exists():
@@ -66,13 +91,22 @@ class EventLogger:
         # Update reason counts
         self.reason_counts[event.reason] = self.reason_counts.get(event.reason, 0) + 1
 
-        # Write immediately to JSONL
-        with open(self.log_path, 'a') as f:
-            json_line = json.dumps(asdict(event))
-            f.write(json_line + '\n')
+        # Write immediately to JSONL (line buffering flushes each event)
+        fh = self._fh
+        if fh is None:
+            fh = self._fh = open(self.log_path, 'a', buffering=1)
+        fh.write(json.dumps(_event_to_dict(event)) + '\n')
+
+    def close(self) -> None:
+        """Close the log file; a later event reopens it in append mode."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
     def dump(self) -> None:
-        """Print human-readable summary to console."""
+        """Close the log file and print human-readable summary to console."""
+        self.close()
+
         if not self.events:
             print("\nNo Shield interventions occurred.")
             return
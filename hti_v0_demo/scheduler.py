@@ -4,7 +4,7 @@ Orchestrates time-banded execution with strict ordering.
 """
 
 import time
-from typing import Optional
+from typing import Callable, Optional
 
 from hti_v0_demo.env import ToyEnv
 from hti_v0_demo.shared_state import SharedState
@@ -27,19 +27,27 @@ class TimingStats:
             band: Name of the band
             duration: Execution time in seconds
         """
-        if band not in self.times:
-            self.times[band] = []
-        self.times[band].append(duration)
+        self.recorder(band)(duration)
+
+    def recorder(self, band: str) -> Callable[[float], None]:
+        """Return a callable that records one duration for band.
+
+        Lets the scheduler loop record without a per-call dict lookup.
+
+        Args:
+            band: Name of the band
+        """
+        return self.times.setdefault(band, []).append
 
     def report(self) -> None:
         """Print timing statistics summary."""
-        if not self.times:
+        if not any(self.times.values()):
             return
 
         print("\n=== Timing Stats ===")
         for band in ["semantics", "control", "reflex", "shield"]:
-            if band in self.times:
-                times = self.times[band]
+            times = self.times.get(band)
+            if times:
                 mean_ms = (sum(times) / len(times)) * 1000
                 max_ms = max(times) * 1000
                 print(f"{band:10s}: mean={mean_ms:.2f}ms, max={max_ms:.2f}ms")
@@ -82,7 +90,20 @@ def run_episode(
     state.obs = obs
 
     print(f"Running HTI v0.1 Demo...")
-    print(f"Initial state: x={obs['x']:.3f}, target={obs['x_target']:.3f}")
+    print(f"Initial state: x={obs.x:.3f}, target={obs.x_target:.3f}")
+
+    # Bind hot-loop callables to locals once
+    perf = time.perf_counter
+    semantics_step = bands["semantics"].step
+    control_step = bands["control"].step
+    reflex_step = bands["reflex"].step
+    shield_apply = shield.apply
+    env_step = env.step
+    log_event = logger.log
+    record_semantics = timing_stats.recorder("semantics")
+    record_control = timing_stats.recorder("control")
+    record_reflex = timing_stats.recorder("reflex")
+    record_shield = timing_stats.recorder("shield")
 
     # Main loop
     for tick in range(max_ticks):
@@ -91,45 +112,45 @@ def run_episode(
 
         # Semantics band (10 Hz)
         if tick % 10 == 0:
-            t0 = time.perf_counter()
-            bands["semantics"].step(state)
-            timing_stats.record("semantics", time.perf_counter() - t0)
+            t0 = perf()
+            semantics_step(state)
+            record_semantics(perf() - t0)
 
         # Control band (50 Hz)
         if tick % 2 == 0:
-            t0 = time.perf_counter()
-            bands["control"].step(state)
-            timing_stats.record("control", time.perf_counter() - t0)
+            t0 = perf()
+            control_step(state)
+            record_control(perf() - t0)
 
         # Reflex band (100 Hz)
-        t0 = time.perf_counter()
-        bands["reflex"].step(state)
-        timing_stats.record("reflex", time.perf_counter() - t0)
+        t0 = perf()
+        reflex_step(state)
+        record_reflex(perf() - t0)
 
         # Safety Shield (always last before env.step)
-        t0 = time.perf_counter()
-        safe_u, event = shield.apply(state)
-        timing_stats.record("shield", time.perf_counter() - t0)
+        t0 = perf()
+        safe_u, event = shield_apply(state)
+        record_shield(perf() - t0)
 
         if event is not None:
-            logger.log(event)
+            log_event(event)
             if verbose:
                 print(f"[{tick:4d}] Shield intervention: {event.action_proposed:.4f} → {event.action_final:.4f}")
 
         # Environment step
-        obs, reward, done, info = env.step(safe_u)
+        obs, reward, done, info = env_step(safe_u)
         state.obs = obs
 
         if verbose and tick % 100 == 0:
-            print(f"[{tick:4d}] x={obs['x']:.3f}, target={obs['x_target']:.3f}, action={safe_u:.4f}")
+            print(f"[{tick:4d}] x={obs.x:.3f}, target={obs.x_target:.3f}, action={safe_u:.4f}")
 
         if done:
-            success = info.get("success", False)
+            success = info.success
             print(f"Episode complete after {tick+1} ticks ({state.t:.2f}s simulated)")
             if success:
-                print(f"✓ Target reached! Final distance: {info['distance']:.4f}")
+                print(f"✓ Target reached! Final distance: {info.distance:.4f}")
             else:
-                print(f"✗ Max steps reached. Final distance: {info['distance']:.4f}")
+                print(f"✗ Max steps reached. Final distance: {info.distance:.4f}")
             break
 
     # Print summaries
@@ -141,6 +162,6 @@ def run_episode(
         "ticks": state.tick + 1,
         "simulated_time": state.t,
         "interventions": len(logger.events),
-        "success": info.get("success", False),
-        "final_distance": info.get("distance", 0.0)
+        "success": info.success,
+        "final_distance": info.distance
     }
@@ -7,10 +7,46 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
+class Obs:
+    """Environment observation.
+
+    Unset v0.2 fields fall back like the old dict lookups did: x_true and
+    x_meas default to x, and x_meas_raw defaults to x_meas.
+
+    Attributes:
+        x: Position (backward compatibility, true state)
+        x_true: Ground truth position (v0.2)
+        x_meas: Measured position, clipped to [0.0, 1.0] (v0.2)
+        x_meas_raw: Unclipped measured position (v0.2.1)
+        x_target: Goal position
+    """
+    x: float = 0.0
+    x_true: Optional[float] = None
+    x_meas: Optional[float] = None
+    x_meas_raw: Optional[float] = None
+    x_target: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.x_true is None:
+            self.x_true = self.x
+        if self.x_meas is None:
+            self.x_meas = self.x
+        if self.x_meas_raw is None:
+            self.x_meas_raw = self.x_meas
+
+    def copy(self) -> "Obs":
+        """Snapshot of this observation."""
+        return Obs(self.x, self.x_true, self.x_meas, self.x_meas_raw, self.x_target)
+
+
+@dataclass(slots=True)
 class SemanticsAdvice:
     """High-level advisory output from Semantics band.
 
+    Overwritten in place every Semantics tick; readers must not keep a
+    reference across ticks.
+
     Attributes:
         direction_hint: Suggested direction (-1, 0, or +1)
         confidence: Confidence in the suggestion (0.0 to 1.0)
@@ -19,11 +55,12 @@ class SemanticsAdvice:
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ReflexFlags:
     """Fast pre-check flags from Reflex band.
 
-    STATELESS: Flags are reset/recomputed every tick. Previous flags discarded.
+    STATELESS: Every field is recomputed and overwritten in place every tick.
+    Readers (Shield) must copy values out rather than keep a reference.
     RECOVERY: When mismatch clears, sensor_mismatch automatically becomes False.
 
     Attributes:
@@ -40,7 +77,7 @@ class ReflexFlags:
     mismatch_magnitude: float = 0.0    # v0.2
 
 
-@dataclass
+@dataclass(slots=True)
 class SharedState:
     """Global state shared across all bands in the HTI system.
 
@@ -61,7 +98,7 @@ class SharedState:
     """
     t: float = 0.0
     tick: int = 0
-    obs: dict[str, float] = field(default_factory=dict)
+    obs: Obs = field(default_factory=Obs)
 
     # Control → Shield action flow
     action_proposed: Optional[float] = None
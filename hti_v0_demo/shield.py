@@ -4,7 +4,7 @@ Always runs last in the band ordering. Enforces hard bounds and logs interventio
 """
 
 from typing import Optional
-from hti_v0_demo.shared_state import SharedState
+from hti_v0_demo.shared_state import SharedState, ReflexFlags
 from hti_v0_demo.event_log import EventPack
 
 
@@ -50,34 +50,22 @@ class SafetyShield:
         Returns:
             Tuple of (safe_action, optional_event)
         """
-        proposed = state.action_proposed if state.action_proposed is not None else 0.0
+        proposed = state.action_proposed
+        if proposed is None:
+            proposed = 0.0
+        flags = state.reflex_flags
 
         # PRECEDENCE 1: Sensor mismatch (Zen MCP #1 - trust ReflexBand flag)
-        if state.reflex_flags.sensor_mismatch:
+        if flags.sensor_mismatch:
             safe_action = 0.0
             state.action_final = safe_action
 
             # Zen MCP #5: Generate event even if proposed==0.0
-            event = EventPack(
-                timestamp=state.t,
-                tick=state.tick,
-                band="SafetyShield",
-                obs_before=state.obs.copy(),
-                action_proposed=proposed,
-                action_final=safe_action,
-                reason="stop_sensor_mismatch",  # v0.2
-                metadata={
-                    "near_boundary": state.reflex_flags.near_boundary,
-                    "too_fast": state.reflex_flags.too_fast,
-                    "distance_to_boundary": state.reflex_flags.distance_to_boundary,
-                    "sensor_mismatch": state.reflex_flags.sensor_mismatch,
-                    "mismatch_magnitude": state.reflex_flags.mismatch_magnitude
-                }
-            )
+            event = self._make_event(state, flags, proposed, safe_action, "stop_sensor_mismatch")  # v0.2
             return safe_action, event
 
         # PRECEDENCE 2: Boundary-aware clipping
-        conservative_mode = state.reflex_flags.near_boundary
+        conservative_mode = flags.near_boundary
 
         # Set bounds (potentially stricter if near boundary)
         if conservative_mode:
@@ -90,8 +78,9 @@ class SafetyShield:
             u_max_effective = self.u_max
             reason_prefix = "clip_out_of_bounds"
 
-        # Clip to bounds
-        safe_action = max(u_min_effective, min(u_max_effective, proposed))
+        # Clip to bounds (conditionals match max(lo, min(hi, proposed)))
+        safe_action = proposed if proposed < u_max_effective else u_max_effective
+        safe_action = safe_action if safe_action > u_min_effective else u_min_effective
 
         # Update state
         state.action_final = safe_action
@@ -99,21 +88,36 @@ class SafetyShield:
         # Generate event if we intervened
         event = None
         if abs(safe_action - proposed) > 1e-9:  # Intervention occurred
-            event = EventPack(
-                timestamp=state.t,
-                tick=state.tick,
-                band="SafetyShield",
-                obs_before=state.obs.copy(),
-                action_proposed=proposed,
-                action_final=safe_action,
-                reason=reason_prefix,
-                metadata={
-                    "near_boundary": state.reflex_flags.near_boundary,
-                    "too_fast": state.reflex_flags.too_fast,
-                    "distance_to_boundary": state.reflex_flags.distance_to_boundary,
-                    "sensor_mismatch": state.reflex_flags.sensor_mismatch,
-                    "mismatch_magnitude": state.reflex_flags.mismatch_magnitude
-                }
-            )
+            event = self._make_event(state, flags, proposed, safe_action, reason_prefix)
 
         return safe_action, event
+
+    def _make_event(
+        self,
+        state: SharedState,
+        flags: ReflexFlags,
+        proposed: float,
+        safe_action: float,
+        reason: str
+    ) -> EventPack:
+        """Build the EventPack for one intervention.
+
+        Flag values are copied into metadata because ReflexFlags is
+        overwritten in place every tick.
+        """
+        return EventPack(
+            timestamp=state.t,
+            tick=state.tick,
+            band="SafetyShield",
+            obs_before=state.obs.copy(),
+            action_proposed=proposed,
+            action_final=safe_action,
+            reason=reason,
+            metadata={
+                "near_boundary": flags.near_boundary,
+                "too_fast": flags.too_fast,
+                "distance_to_boundary": flags.distance_to_boundary,
+                "sensor_mismatch": flags.sensor_mismatch,
+                "mismatch_magnitude": flags.mismatch_magnitude
+            }
+        )
@@ -0,0 +1,47 @@
+"""Shared pytest fixtures for HTI v0 tests.
+
+Bands and the Shield keep only their configuration between calls (all
+per-tick data lives in SharedState), so one instance per session is reused.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the repo root importable once per session, before any test module
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from hti_v0_demo.shared_state import Obs, SharedState
+from hti_v0_demo.bands import SemanticsBand, ControlBand, ReflexBand
+from hti_v0_demo.shield import SafetyShield
+
+
+@pytest.fixture(scope="session")
+def sem():
+    """Default SemanticsBand"""
+    return SemanticsBand()
+
+
+@pytest.fixture(scope="session")
+def ctrl():
+    """Default ControlBand (gain=0.3)"""
+    return ControlBand()
+
+
+@pytest.fixture(scope="session")
+def reflex():
+    """Default ReflexBand"""
+    return ReflexBand()
+
+
+@pytest.fixture(scope="session")
+def shield():
+    """SafetyShield with the default [-0.05, 0.05] bounds"""
+    return SafetyShield(u_min=-0.05, u_max=0.05)
+
+
+@pytest.fixture
+def base_state():
+    """Fresh SharedState at x=0.5 heading for x_target=0.8"""
+    return SharedState(obs=Obs(x=0.5, x_target=0.8))
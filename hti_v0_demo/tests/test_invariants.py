@@ -3,66 +3,75 @@
 Tests the 7 core invariants from SPEC.md Section 3.
 """
 
-import sys
-from pathlib import Path
+import pytest
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from hti_v0_demo.shared_state import SharedState
-from hti_v0_demo.bands import SemanticsBand, ControlBand, ReflexBand
+from hti_v0_demo import scheduler
+from hti_v0_demo.shared_state import Obs, SharedState
+from hti_v0_demo.bands import ReflexBand
 from hti_v0_demo.shield import SafetyShield
 from hti_v0_demo.env import ToyEnv
 
 
-def test_semantics_advisory_only():
+@pytest.fixture(scope="module")
+def shield_state():
+    """One SharedState reused across the parametrized shield cases"""
+    return SharedState(obs=Obs(x=0.5, x_target=0.8))
+
+
+def reset(state, tick, proposed):
+    """Reset the per-tick action fields of a reused SharedState"""
+    state.tick = tick
+    state.action_proposed = proposed
+    state.action_final = None
+
+
+def test_semantics_advisory_only(sem, base_state):
     """Invariant #3: Semantics may not write action_proposed or action_final"""
-    state = SharedState(obs={"x": 0.5, "x_target": 0.8})
+    state = base_state
     state.action_proposed = 0.03  # Set by prior band
 
-    sem = SemanticsBand()
     sem.step(state)
 
     # Assert semantics didn't touch action
     assert state.action_proposed == 0.03, "Semantics modified action_proposed"
     assert state.action_final is None, "Semantics modified action_final"
     # But did write advice
-    assert state.semantics_advice.direction_hint in [-1, 0, 1], "Semantics didn't write valid advice"
-    print("✓ Test passed: Semantics is advisory-only")
+    assert state.semantics_advice.direction_hint in (-1, 0, 1), "Semantics didn't write valid advice"
 
 
-def test_shield_bounds_actions():
+@pytest.mark.parametrize("proposed,expected", [
+    (0.10, 0.05),
+    (-0.10, -0.05),
+    (0.03, 0.03),
+    (-0.02, -0.02),
+    (0.0, 0.0),
+])
+def test_shield_bounds_actions(shield, shield_state, proposed, expected):
     """Invariant #4: action_final is always within bounds"""
-    state = SharedState(obs={"x": 0.5, "x_target": 0.8})
-    shield = SafetyShield(u_min=-0.05, u_max=0.05)
-
-    # Test out-of-bounds proposals
-    test_cases = [0.10, -0.10, 0.03, -0.02, 0.0]
-
-    for proposed in test_cases:
-        state.action_proposed = proposed
-        safe_u, event = shield.apply(state)
-
-        assert -0.05 <= safe_u <= 0.05, f"Action {safe_u} out of bounds for proposal {proposed}"
-        assert state.action_final == safe_u, "action_final doesn't match returned safe_u"
+    state = shield_state
+    reset(state, 0, proposed)
+    safe_u, event = shield.apply(state)
 
-    print("✓ Test passed: Shield bounds actions")
+    assert abs(safe_u) <= 0.05, f"Action {safe_u} out of bounds for proposal {proposed}"
+    assert safe_u == pytest.approx(expected), f"Proposal {proposed} clipped to {safe_u}, expected {expected}"
+    assert state.action_final == safe_u, "action_final doesn't match returned safe_u"
 
 
-def test_event_pack_on_clipping():
+def test_event_pack_on_clipping(shield, base_state):
     """Invariant #5: EventPack generated when Shield intervenes"""
-    state = SharedState(obs={"x": 0.5, "x_target": 0.8}, tick=42, t=0.42)
-    shield = SafetyShield(u_min=-0.05, u_max=0.05)
+    state = base_state
+    state.tick = 42
+    state.t = 0.42
 
     # Propose out-of-bounds action
     state.action_proposed = 0.10
     safe_u, event = shield.apply(state)
 
     # Should have clipped and logged
-    assert safe_u == 0.05, "Shield didn't clip to max bound"
+    assert safe_u == pytest.approx(0.05), "Shield didn't clip to max bound"
     assert event is not None, "No event generated on clip"
     assert event.action_proposed == 0.10, "Event has wrong proposed action"
-    assert event.action_final == 0.05, "Event has wrong final action"
+    assert event.action_final == pytest.approx(0.05), "Event has wrong final action"
     assert event.band == "SafetyShield", "Event has wrong band"
     assert event.tick == 42, "Event has wrong tick"
 
@@ -71,99 +80,62 @@ def test_event_pack_on_clipping():
     safe_u, event = shield.apply(state)
 
     # Should NOT log
-    assert safe_u == 0.03, "Shield modified in-bounds action"
+    assert safe_u == pytest.approx(0.03), "Shield modified in-bounds action"
     assert event is None, "Event generated for in-bounds action"
 
-    print("✓ Test passed: Event-pack on clipping")
-
 
-def test_scheduler_frequencies():
+@pytest.mark.parametrize("band_name,period", [
+    ("SemanticsBand", 10),
+    ("ControlBand", 2),
+    ("ReflexBand", 1),
+])
+def test_scheduler_frequencies(monkeypatch, tmp_path, band_name, period):
     """Invariant #2 (partial): Bands fire at correct frequencies"""
-    # Track which ticks each band fires on
-    semantics_ticks = []
-    control_ticks = []
-    reflex_ticks = []
-
-    # Simulate scheduling logic for 100 ticks
-    for tick in range(100):
-        if tick % 10 == 0:
-            semantics_ticks.append(tick)
-        if tick % 2 == 0:
-            control_ticks.append(tick)
-        reflex_ticks.append(tick)
-
-    # Assert frequencies
-    assert semantics_ticks == [0, 10, 20, 30, 40, 50, 60, 70, 80, 90], "Semantics wrong frequency"
-    assert len(control_ticks) == 50, f"Control wrong frequency: {len(control_ticks)} != 50"
-    assert control_ticks[0] == 0 and control_ticks[1] == 2, "Control wrong start"
-    assert len(reflex_ticks) == 100, f"Reflex wrong frequency: {len(reflex_ticks)} != 100"
-
-    print("✓ Test passed: Scheduler frequencies")
-
-
-def test_shield_runs_last():
-    """Invariant #2 (partial): Shield executes after all bands"""
-    # This is enforced by the scheduler structure - test the data flow
-    state = SharedState(obs={"x": 0.5, "x_target": 0.8}, tick=0)
-
-    # Simulate one tick with all bands
-    sem = SemanticsBand()
-    ctrl = ControlBand()
-    reflex = ReflexBand()
-    shield = SafetyShield()
-
-    # Execute in order
-    sem.step(state)
-    assert state.action_proposed is None, "Semantics set action_proposed"
+    fired_ticks = []
+    band_cls = getattr(scheduler, band_name)
 
-    ctrl.step(state)
-    assert state.action_proposed is not None, "Control didn't set action_proposed"
-    assert state.action_final is None, "Control set action_final"
+    class RecordingBand(band_cls):
+        def step(self, state):
+            fired_ticks.append(state.tick)
+            super().step(state)
 
-    reflex.step(state)
-    assert state.action_final is None, "Reflex set action_final"
+    monkeypatch.setattr(scheduler, band_name, RecordingBand)
+    monkeypatch.chdir(tmp_path)  # run_episode writes event_log.jsonl to cwd
 
-    safe_u, event = shield.apply(state)
-    assert state.action_final is not None, "Shield didn't set action_final"
+    # Zero gain keeps the episode from reaching the target early
+    result = scheduler.run_episode(max_ticks=100, control_gain=0.0)
 
-    print("✓ Test passed: Shield runs last (data flow)")
+    assert result["ticks"] == 100, "Episode ended before 100 ticks"
+    assert fired_ticks == list(range(0, 100, period)), f"{band_name} wrong frequency"
 
 
-def test_causality_within_tick():
-    """Invariant #7: Bands can read earlier bands' outputs from same tick"""
-    state = SharedState(obs={"x": 0.5, "x_target": 0.8}, tick=0)
+def test_pipeline_invariants(sem, ctrl, reflex, shield, base_state):
+    """Invariants #2 (partial) and #7: Shield executes after all bands, and
+    bands can read earlier bands' outputs from the same tick"""
+    # Ordering is enforced by the scheduler structure - test the data flow
+    state = base_state
 
-    # Semantics writes advice at tick 0
-    sem = SemanticsBand()
+    # Simulate one tick with all bands, in order
     sem.step(state)
+    assert state.action_proposed is None, "Semantics set action_proposed"
+    assert state.semantics_advice.direction_hint != 0, "Semantics should suggest direction"
 
-    semantics_hint = state.semantics_advice.direction_hint
-    assert semantics_hint != 0, "Semantics should suggest direction"
-
-    # Control at tick 0 should see that advice
-    ctrl = ControlBand()
+    # Control at tick 0 sees the advice Semantics just wrote
     ctrl.step(state)
+    assert state.action_proposed is not None, "Control didn't set action_proposed"
+    assert state.action_final is None, "Control set action_final"
 
-    # Control should have written action_proposed
-    assert state.action_proposed is not None, "Control didn't propose action"
-
-    # Verify Control had access to semantics_advice (implicit in its logic)
-    # We can't directly test what Control "read", but we verified it can access
-    # the semantics_advice that was written in the same tick
-
-    print("✓ Test passed: Causality within tick")
+    reflex.step(state)
+    assert state.action_final is None, "Reflex set action_final"
 
+    safe_u, event = shield.apply(state)
+    assert state.action_final is not None, "Shield didn't set action_final"
 
-def test_bounded_final_commands():
-    """Invariant #4 (extended): Verify bounds in realistic scenario"""
-    env = ToyEnv()
-    state = SharedState()
-    shield = SafetyShield(u_min=-0.05, u_max=0.05)
 
-    obs = env.reset(x0=0.1, x_target=0.9)
-    state.obs = obs
+def test_bounded_final_commands(shield, base_state):
+    """Invariant #4 (extended): Bounds hold on every tick of a repeated overshoot"""
+    state = base_state
 
-    # Run a few steps
     for tick in range(10):
         state.tick = tick
         state.t = tick * 0.01
@@ -174,15 +146,9 @@ def test_bounded_final_commands():
         # Shield must bound it
         safe_u, event = shield.apply(state)
 
-        assert -0.05 <= safe_u <= 0.05, f"Tick {tick}: action {safe_u} out of bounds"
+        assert abs(safe_u) <= 0.05, f"Tick {tick}: action {safe_u} out of bounds"
         assert event is not None, f"Tick {tick}: no event for out-of-bounds action"
 
-        # Step environment
-        obs, reward, done, info = env.step(safe_u)
-        state.obs = obs
-
-    print("✓ Test passed: Bounded final commands")
-
 
 def test_shield_rejects_invalid_bounds():
     """Invariant: SafetyShield must enforce u_min <= u_max"""
@@ -198,19 +164,16 @@ def test_shield_rejects_invalid_bounds():
     except ValueError as e:
         assert "u_min" in str(e) and "u_max" in str(e), "Error message should mention bounds"
 
-    print("✓ Test passed: Shield rejects invalid bounds")
 
-
-def test_sensor_mismatch_triggers_stop():
+def test_sensor_mismatch_triggers_stop(ctrl, shield):
     """Invariant #9 (v0.2): Sensor mismatch → action_final=0.0"""
     state = SharedState(
-        obs={"x": 0.5, "x_true": 0.5, "x_meas": 0.8, "x_meas_raw": 0.8, "x_target": 0.9},
+        obs=Obs(x=0.5, x_true=0.5, x_meas=0.8, x_meas_raw=0.8, x_target=0.9),
         tick=55,
         t=0.55
     )
 
     # Control proposes action based on corrupted measurement
-    ctrl = ControlBand()
     ctrl.step(state)
     proposed = state.action_proposed
 
@@ -222,7 +185,6 @@ def test_sensor_mismatch_triggers_stop():
     assert state.reflex_flags.mismatch_magnitude > 0.05, "Mismatch magnitude should exceed threshold"
 
     # Shield STOPS (action_final = 0.0)
-    shield = SafetyShield()
     safe_u, event = shield.apply(state)
 
     assert safe_u == 0.0, "Shield must stop on sensor mismatch"
@@ -231,14 +193,11 @@ def test_sensor_mismatch_triggers_stop():
     assert event.reason == "stop_sensor_mismatch", f"Wrong reason: {event.reason}"
     assert event.action_final == 0.0, "Event must record action_final=0.0"
 
-    print("✓ Test passed: Sensor mismatch triggers stop")
-
 
-def test_recovery_after_glitch_window():
+def test_recovery_after_glitch_window(shield):
     """Invariant #10 (v0.2): Automatic recovery (stateless flags)"""
     env = ToyEnv(enable_glitches=True, glitch_start_tick=50, glitch_end_tick=70, glitch_magnitude=0.3)
     reflex = ReflexBand(mismatch_threshold=0.05)
-    shield = SafetyShield()
     state = SharedState()
 
     obs = env.reset(x0=0.5, x_target=0.8)
@@ -273,16 +232,14 @@ def test_recovery_after_glitch_window():
     reflex.step(state)
     assert state.reflex_flags.sensor_mismatch is False, "Mismatch clears after glitch"
     safe_u, event = shield.apply(state)
-    assert safe_u == 0.03, "Shield resumes normal operation after glitch"
+    assert safe_u == pytest.approx(0.03), "Shield resumes normal operation after glitch"
     assert event is None or event.reason != "stop_sensor_mismatch", "No stop after recovery"
 
-    print("✓ Test passed: Recovery after glitch window")
-
 
-def test_no_op_event_generation():
+def test_no_op_event_generation(shield):
     """Invariant #11 (v0.2): EventPack even if action_proposed==0.0"""
     state = SharedState(
-        obs={"x": 0.5, "x_true": 0.5, "x_meas": 0.8, "x_meas_raw": 0.8, "x_target": 0.9},
+        obs=Obs(x=0.5, x_true=0.5, x_meas=0.8, x_meas_raw=0.8, x_target=0.9),
         tick=60,
         t=0.60
     )
@@ -296,7 +253,6 @@ def test_no_op_event_generation():
     assert state.reflex_flags.sensor_mismatch is True
 
     # Shield stops (action_final = 0.0, same as proposed)
-    shield = SafetyShield()
     safe_u, event = shield.apply(state)
 
     assert safe_u == 0.0, "action_final is 0.0"
@@ -308,10 +264,8 @@ def test_no_op_event_generation():
     assert event.action_proposed == 0.0, "Event records proposed=0.0"
     assert event.action_final == 0.0, "Event records final=0.0"
 
-    print("✓ Test passed: No-op event generation")
 
-
-def test_boundary_glitch_detection():
+def test_boundary_glitch_detection(shield):
     """Invariant #12 (v0.2.1): Glitches detected even near boundaries (critical bug fix)
 
     This test addresses the critical bug found by GPT-5.1-Codex where clipping
@@ -322,13 +276,13 @@ def test_boundary_glitch_detection():
     """
     # Test near UPPER boundary (where original bug manifested)
     state = SharedState(
-        obs={
-            "x": 0.95,           # Very close to upper bound (1.0)
-            "x_true": 0.95,
-            "x_meas": 1.0,       # Clipped (0.95 + 0.3 = 1.25 → clipped to 1.0)
-            "x_meas_raw": 1.25,  # Unclipped (raw sensor reading)
-            "x_target": 0.8
-        },
+        obs=Obs(
+            x=0.95,           # Very close to upper bound (1.0)
+            x_true=0.95,
+            x_meas=1.0,       # Clipped (0.95 + 0.3 = 1.25 → clipped to 1.0)
+            x_meas_raw=1.25,  # Unclipped (raw sensor reading)
+            x_target=0.8
+        ),
         tick=10,
         t=0.10
     )
@@ -344,7 +298,6 @@ def test_boundary_glitch_detection():
         f"Mismatch magnitude should be ~0.3, got {state.reflex_flags.mismatch_magnitude}"
 
     # Shield MUST stop
-    shield = SafetyShield()
     safe_u, event = shield.apply(state)
     assert safe_u == 0.0, "Shield must stop on boundary glitch"
     assert event is not None, "Event must be generated"
@@ -352,13 +305,13 @@ def test_boundary_glitch_detection():
 
     # Test near LOWER boundary
     state_lower = SharedState(
-        obs={
-            "x": 0.05,           # Very close to lower bound (0.0)
-            "x_true": 0.05,
-            "x_meas": 0.0,       # Clipped (0.05 - 0.1 = -0.05 → clipped to 0.0)
-            "x_meas_raw": -0.05, # Unclipped (negative sensor reading)
-            "x_target": 0.2
-        },
+        obs=Obs(
+            x=0.05,           # Very close to lower bound (0.0)
+            x_true=0.05,
+            x_meas=0.0,       # Clipped (0.05 - 0.1 = -0.05 → clipped to 0.0)
+            x_meas_raw=-0.05, # Unclipped (negative sensor reading)
+            x_target=0.2
+        ),
         tick=15,
         t=0.15
     )
@@ -369,54 +322,20 @@ def test_boundary_glitch_detection():
     assert state_lower.reflex_flags.mismatch_magnitude > 0.05, \
         f"Mismatch magnitude should be ~0.1, got {state_lower.reflex_flags.mismatch_magnitude}"
 
-    print("✓ Test passed: Boundary glitch detection (v0.2.1 critical fix)")
-
-
-def run_all_tests():
-    """Run all invariant tests."""
-    print("Running HTI v0.1.1 + v0.2 + v0.2.1 Invariant Tests\n")
-
-    tests = [
-        # v0.1.1 tests (must still pass)
-        test_semantics_advisory_only,
-        test_shield_bounds_actions,
-        test_event_pack_on_clipping,
-        test_scheduler_frequencies,
-        test_shield_runs_last,
-        test_causality_within_tick,
-        test_bounded_final_commands,
-        test_shield_rejects_invalid_bounds,
-        # v0.2 tests (new)
-        test_sensor_mismatch_triggers_stop,
-        test_recovery_after_glitch_window,
-        test_no_op_event_generation,
-        # v0.2.1 tests (critical bug fix)
-        test_boundary_glitch_detection,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test in tests:
-        try:
-            test()
-            passed += 1
-        except AssertionError as e:
-            print(f"✗ Test failed: {test.__name__}")
-            print(f"  {e}")
-            failed += 1
-        except Exception as e:
-            print(f"✗ Test error: {test.__name__}")
-            print(f"  {e}")
-            failed += 1
-
-    print(f"\n{'='*50}")
-    print(f"Results: {passed} passed, {failed} failed")
-    print(f"{'='*50}")
-
-    return failed == 0
-
-
-if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+
+def test_reflex_custom_bounds():
+    """ReflexBand measures boundary distance against configured env bounds"""
+    state = SharedState(obs=Obs(x=1.5, x_target=1.8))
+    state.action_proposed = 0.0
+
+    reflex = ReflexBand(lower=1.0, upper=2.0)
+    reflex.step(state)
+
+    assert state.reflex_flags.distance_to_boundary == pytest.approx(0.5), "Distance should use custom bounds"
+    assert state.reflex_flags.near_boundary is False, "Midpoint should not be near a boundary"
+
+    try:
+        ReflexBand(lower=1.0, upper=0.0)
+        assert False, "ReflexBand should reject lower > upper"
+    except ValueError as e:
+        assert "lower" in str(e) and "upper" in str(e), "Error message should mention bounds"